@@ -16,7 +16,7 @@ from .core.engine import TechnicalEngine
 from .core.backtester import BacktestEngine
 
 # From strategy.py
-from .core.strategy import Strategy
+from .core.strategy import Strategy, FastSignals
 
 # From context.py
 from .core.context import LiveContext, BacktestContext, IContext
@@ -36,6 +36,7 @@ __all__ = [
     "TechnicalEngine",
     "BacktestEngine",
     "Strategy",
+    "FastSignals",
     "LiveContext",
     "BacktestContext",
     "IContext",
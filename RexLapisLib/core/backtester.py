@@ -1,16 +1,19 @@
+import numpy as np
 import pandas as pd
 import time
 from typing import Dict, Any
-from .strategy import Strategy
+from .strategy import Strategy, FastSignals
 from .context import BacktestContext
 from .engine import TechnicalEngine 
+from .kernels import _long_only_backtest
 
 class BacktestEngine:
-    def __init__(self, strategy: Strategy, initial_balance: float = 10000):
+    def __init__(self, strategy: Strategy, initial_balance: float = 10000, float32: bool = False):
         self.strategy = strategy
         self.context = BacktestContext(initial_balance)
         self.strategy.setup(self.context) 
-        self.tech_engine = TechnicalEngine()
+        # float32=True halves the indicator columns' memory on long backtests
+        self.tech_engine = TechnicalEngine(float32=float32)
 
     def run(self, df: pd.DataFrame) -> Dict[str, Any]:
         """
@@ -29,28 +32,34 @@ class BacktestEngine:
 
         # 1. Pre-calculate Indicators
         full_data = self.tech_engine.apply_all_indicators(df.copy())
+        self.strategy.prepare(full_data)
         
         # 2. The Time Loop
         # Warmup period allows indicators (like RSI or MA) to stabilize
         warmup_period = 50 
         total_candles = len(full_data)
 
-        for i in range(warmup_period, total_candles):
-            # Slicing: Ensure the strategy only sees data up to the current index (No Look-ahead bias)
-            current_slice = full_data.iloc[:i+1]
-            current_candle = current_slice.iloc[-1]
+        fast = self.strategy.fast_signals(full_data)
+        if fast is not None:
+            # Numeric strategies: replay precomputed decisions over plain arrays
+            self._run_fast(full_data, fast, warmup_period)
+        else:
+            for i in range(warmup_period, total_candles):
+                # Slicing: Ensure the strategy only sees data up to the current index (No Look-ahead bias)
+                current_slice = full_data.iloc[:i+1]
+                current_candle = current_slice.iloc[-1]
             
-            # --- CRITICAL: State Synchronization ---
-            # Update Context State with full candle data (High, Low, Close, Timestamp)
-            # This is required for the Context to check if Limit orders were hit.
-            self.context.update_state(
-                price=current_candle['close'], 
-                time=current_candle['timestamp'],
-                candle=current_candle  
-            )
+                # --- CRITICAL: State Synchronization ---
+                # Update Context State with full candle data (High, Low, Close, Timestamp)
+                # This is required for the Context to check if Limit orders were hit.
+                self.context.update_state(
+                    price=current_candle['close'], 
+                    time=current_candle['timestamp'],
+                    candle=current_candle  
+                )
             
-            # Execute Strategy logic
-            self.strategy.on_candle_tick(current_slice)
+                # Execute Strategy logic
+                self.strategy.on_candle_tick(current_slice)
 
         # 3. Finalize Results
         execution_time = time.time() - start_time
@@ -58,6 +67,37 @@ class BacktestEngine:
 
         return self._generate_report(full_data)
 
+    def _run_fast(self, df: pd.DataFrame, fast: FastSignals, start: int):
+        """
+        Compiled equivalent of the candle loop for FastSignals strategies.
+        Leaves the context (balance, position, trades) as the loop would.
+        """
+        ctx = self.context
+        trades = np.empty((len(df), 4))
+
+        balance, count, qty, entry, margin = _long_only_backtest(
+            df['close'].to_numpy(dtype=np.float64),
+            np.asarray(fast.enter, dtype=np.bool_),
+            np.asarray(fast.exit, dtype=np.bool_),
+            start, float(ctx.balance), float(ctx.leverage), float(ctx.fee_rate),
+            float(fast.risk), float(fast.leverage), int(fast.qty_decimals), float(fast.min_qty),
+            trades
+        )
+
+        timestamps = df['timestamp']
+        for row, kind, price, value in trades[:count].tolist():
+            t = timestamps.iat[int(row)]
+            if kind:
+                ctx.trades.append({'type': 'Buy', 'price': price, 'qty': value, 'time': t})
+            else:
+                ctx.trades.append({'type': 'Close', 'price': price, 'pnl': value, 'time': t})
+
+        ctx.balance = balance
+        ctx.position = {'side': 'Buy', 'qty': qty, 'entry_price': entry, 'margin_used': margin} if qty else None
+        if len(df) > start:
+            ctx.current_price = float(df['close'].iat[-1])
+            ctx.current_time = timestamps.iat[-1]
+
     def _generate_report(self, df: pd.DataFrame) -> Dict[str, Any]:
         """
         Formats the final simulation results for the Visualizer and Dashboard.
@@ -1,13 +1,22 @@
 import os
 import time
+import threading
 import pandas as pd
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
 from decimal import Decimal, ROUND_FLOOR, ROUND_CEILING
 from functools import wraps
 from dotenv import load_dotenv
 
-from pybit.unified_trading import HTTP, WebSocket
+from pybit.unified_trading import HTTP, WebSocket, WebSocketTrading
 from pybit.exceptions import InvalidRequestError, FailedRequestError
-from requests.exceptions import ConnectionError, Timeout
+from requests.adapters import HTTPAdapter
+from requests.exceptions import ConnectionError, ReadTimeout, SSLError, Timeout
+
+try:
+    import orjson
+except ImportError:
+    # orjson is optional: get_candles falls back to pybit's own (stdlib json) parsing
+    orjson = None
 
 # Load environment variables
 load_dotenv()
@@ -58,9 +67,22 @@ class Client:
         if self.endpoint_env == "demo":
             self.session.endpoint = self.http_url
 
+        # pybit already sends through one requests.Session; size its pool so the
+        # trading loop, keep-alive pinger and stream callbacks reuse warm TLS sockets
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=4)
+        self.session.client.mount("https://", adapter)
+        self.session.client.headers["Connection"] = "keep-alive"
+
         print(f"[{self.symbol}] Client initialized for {self.category.upper()} on {self.endpoint_env.upper()}")
         self.precision_data = self._fetch_symbol_info()
 
+        # Optional persistent WebSocket trade connection (see enable_ws_trading)
+        self.ws_trade = None
+        self.ws_trade_timeout = 5.0
+
+        # Optional keep-alive pinger for the HTTP session (see start_keepalive)
+        self._keepalive_stop = None
+
     # ==================================================================
     # HELPER: PRECISION & ROUNDING (Internal)
     # ==================================================================
@@ -197,18 +219,27 @@ class Client:
             }
         return None
 
+    @auto_resync()
     def get_candles(self, interval: str, limit: int = 200):
         """
         Fetches historical klines.
         :param interval: "1", "5", "15", "60", "D"
         :return: List of dicts [Oldest -> Newest]
         """
-        response = self.session.get_kline(
-            category=self.category, 
-            symbol=self.symbol,
-            interval=interval,
-            limit=limit
-        )
+        if orjson is not None:
+            response = self._get_public_orjson("/v5/market/kline", {
+                "category": self.category,
+                "symbol": self.symbol,
+                "interval": interval,
+                "limit": limit
+            })
+        else:
+            response = self.session.get_kline(
+                category=self.category, 
+                symbol=self.symbol,
+                interval=interval,
+                limit=limit
+            )
         
         raw_list = response["result"]["list"]
         raw_list.reverse() 
@@ -226,6 +257,57 @@ class Client:
             
         return cleaned_data
 
+    def _get_public_orjson(self, path: str, params: dict) -> dict:
+        """
+        Unsigned GET on the pooled pybit session, parsed with orjson (much faster
+        than the stdlib json pybit uses). Network errors, unparsable bodies and the
+        session's retry_codes (10002, 10006, ...) are retried up to session.max_retries
+        times, every retry_delay seconds (rate limits wait for the reset); other HTTP
+        and API errors raise like pybit.
+        """
+        http = self.session
+        request = f"GET {path}: {params}"
+        attempts_left = http.max_retries
+
+        while attempts_left > 0:
+            attempts_left -= 1
+            try:
+                response = http.client.get(http.endpoint + path, params=params, timeout=http.timeout)
+                if response.status_code != 200:
+                    raise FailedRequestError(
+                        request=request, message=f"HTTP {response.status_code}: {response.text}",
+                        status_code=response.status_code, time=time.strftime("%H:%M:%S"), resp_headers=response.headers
+                    )
+                payload = orjson.loads(response.content)
+            except (ReadTimeout, SSLError, ConnectionError, orjson.JSONDecodeError) as e:
+                if attempts_left == 0:
+                    raise
+                print(f"⚠️ {e} in {path}. Retrying...")
+                time.sleep(http.retry_delay)
+                continue
+
+            ret_code = payload.get("retCode")
+            if ret_code in http.retry_codes:
+                delay = http.retry_delay
+                if ret_code == 10006:
+                    # Rate limited: sleep until the window Bybit reports resets
+                    reset_ms = int(response.headers.get("X-Bapi-Limit-Reset-Timestamp", time.time() * 1000 + 2000))
+                    delay = max(0.0, reset_ms / 1000 - time.time())
+                print(f"⚠️ {payload.get('retMsg')} (ErrCode: {ret_code}) in {path}. Retrying...")
+                time.sleep(delay)
+                continue
+            if ret_code != 0:
+                raise InvalidRequestError(
+                    request=request, message=payload.get("retMsg"),
+                    status_code=ret_code, time=time.strftime("%H:%M:%S"), resp_headers=response.headers
+                )
+            return payload
+
+        raise FailedRequestError(
+            request=request, message="Bad Request. Retries exceeded maximum.",
+            status_code=400, time=time.strftime("%H:%M:%S"), resp_headers=None
+        )
+
     @auto_resync()
     def get_open_orders(self):
         response = self.session.get_open_orders(category=self.category, symbol=self.symbol)
@@ -276,13 +358,48 @@ class Client:
             if "110043" not in str(e):
                 print(f"Warning setting leverage: {e}")
 
+    def enable_ws_trading(self, timeout: float = 5.0):
+        """
+        Opens a persistent WebSocket trade connection (wss://.../v5/trade).
+        While it is connected, place_limit_order sends 'order.create' frames over it
+        instead of a signed HTTP request, and waits up to `timeout` seconds for the ACK.
+        Mainnet only: Bybit has no trade socket for demo accounts (their keys do not
+        authenticate on stream-testnet), so on "demo" orders stay on HTTP.
+        """
+        if self.endpoint_env == "demo":
+            print(f"[{self.symbol}] WebSocket trading is not available on DEMO. Orders will use HTTP.")
+            return
+
+        self.ws_trade = WebSocketTrading(
+            testnet=self.testnet,
+            api_key=self.api_key,
+            api_secret=self.api_secret,
+        )
+        self.ws_trade_timeout = timeout
+        print(f"[{self.symbol}] WebSocket trading enabled.")
+
+    def _place_order_ws(self, **params) -> str:
+        """Sends an order over the trade WebSocket and blocks until Bybit acknowledges it."""
+        ack = Future()
+
+        def on_error(msg):
+            ack.set_exception(Exception(f"{msg.get('retMsg')} (ErrCode: {msg.get('retCode')})"))
+
+        self.ws_trade.place_order(callback=ack.set_result, error_callback=on_error, **params)
+        try:
+            response = ack.result(timeout=self.ws_trade_timeout)
+        except FutureTimeoutError:
+            # Not retried: the order may still have reached the book
+            raise Exception(f"WebSocket order ACK timed out after {self.ws_trade_timeout}s")
+        return response['data']['orderId']
+
     @auto_resync()
     def place_limit_order(self, side: str, qty: float, price: float, reduce_only: bool = False, post_only: bool = False) -> str:
         safe_qty = self._round_qty(qty)
         safe_price = self._round_price(price, side)
         tif = "PostOnly" if post_only else "GTC"
 
-        response = self.session.place_order(
+        params = dict(
             category=self.category, 
             symbol=self.symbol,
             side=side.capitalize(),
@@ -292,8 +409,54 @@ class Client:
             timeInForce=tif, 
             reduceOnly=reduce_only
         )
+        if self.ws_trade is not None and self.ws_trade.is_connected():
+            return self._place_order_ws(**params)
+
+        response = self.session.place_order(**params)
         return response['result']['orderId']
 
+    # Bybit V5 accepts up to 10 orders per create-batch call on every category
+    BATCH_ORDER_LIMIT = 10
+
+    def place_batch_limit_orders(self, orders: list) -> list:
+        """
+        Places many limit orders via POST /v5/order/create-batch, 10 per request.
+        :param orders: List of dicts with place_limit_order's arguments
+                       (side, qty, price, reduce_only, post_only).
+        :return: One entry per order, in order: the order ID, or the Exception that rejected it.
+        """
+        results = []
+        for start in range(0, len(orders), self.BATCH_ORDER_LIMIT):
+            chunk = orders[start:start + self.BATCH_ORDER_LIMIT]
+            request = [{
+                "symbol": self.symbol,
+                "side": o["side"].capitalize(),
+                "orderType": "Limit",
+                "qty": self._round_qty(o["qty"]),
+                "price": self._round_price(o["price"], o["side"]),
+                "timeInForce": "PostOnly" if o.get("post_only") else "GTC",
+                "reduceOnly": o.get("reduce_only", False)
+            } for o in chunk]
+
+            try:
+                response = self._submit_batch(request)
+            except Exception as e:
+                results.extend([e] * len(chunk))
+                continue
+
+            acks = response["result"]["list"]
+            infos = response["retExtInfo"]["list"]
+            for ack, info in zip(acks, infos):
+                if info.get("code", 0) == 0:
+                    results.append(ack["orderId"])
+                else:
+                    results.append(Exception(f"{info.get('msg')} (ErrCode: {info.get('code')})"))
+        return results
+
+    @auto_resync()
+    def _submit_batch(self, request: list):
+        return self.session.place_batch_order(category=self.category, request=request)
+
     @auto_resync()
     def place_market_order(self, side: str, qty: float, reduce_only: bool = False) -> str:
         safe_qty = self._round_qty(qty)
@@ -336,20 +499,25 @@ class Client:
         history = []
         if "list" in response["result"]:
             for order in response["result"]["list"]:
-                history.append({
-                    "order_id": order["orderId"],
-                    "price": float(order["price"]) if order["price"] else 0.0,
-                    "avg_price": float(order["avgPrice"]) if order["avgPrice"] else 0.0, # Actual execution price
-                    "qty": float(order["qty"]),
-                    "filled_qty": float(order["cumExecQty"]), # Amount actually filled
-                    "side": order["side"],
-                    "type": order["orderType"],
-                    "status": order["orderStatus"], # e.g., 'Filled', 'Cancelled'
-                    "reduce_only": order["reduceOnly"],
-                    "created_time": int(order["createdTime"]),
-                    "updated_time": int(order["updatedTime"])
-                })
+                history.append(self._format_order(order))
         return history
+
+    @staticmethod
+    def _format_order(order) -> dict:
+        """Normalizes a raw V5 order (REST history or private WS stream) to our dict format."""
+        return {
+            "order_id": order["orderId"],
+            "price": float(order["price"]) if order["price"] else 0.0,
+            "avg_price": float(order["avgPrice"]) if order["avgPrice"] else 0.0, # Actual execution price
+            "qty": float(order["qty"]),
+            "filled_qty": float(order["cumExecQty"]), # Amount actually filled
+            "side": order["side"],
+            "type": order["orderType"],
+            "status": order["orderStatus"], # e.g., 'Filled', 'Cancelled'
+            "reduce_only": order["reduceOnly"],
+            "created_time": int(order["createdTime"]),
+            "updated_time": int(order["updatedTime"])
+        }
     
     def get_historical_klines(self, interval: str, start_time_ms: int, end_time_ms: int = None):
         """Fetches historical candles with pagination support."""
@@ -376,18 +544,23 @@ class Client:
 
         # Cleanup and convert to DataFrame
         df = pd.DataFrame(all_candles, columns=["timestamp", "open", "high", "low", "close", "volume", "turnover"])
-        df["timestamp"] = pd.to_datetime(df["timestamp"].astype(float), unit='ms')
+        # Integer ms straight to datetime64 (no float round-trip)
+        df["timestamp"] = df["timestamp"].to_numpy(dtype="int64").astype("datetime64[ms]")
         for col in ["open", "high", "low", "close", "volume"]:
             df[col] = df[col].astype(float)
-        return df.sort_values("timestamp").reset_index(drop=True)
-    def start_kline_stream(self, callback, interval: str = "1"):
+        # Pages arrive newest-first, so reversing orders them; no O(N log N) sort
+        if len(df) > 1 and df["timestamp"].iat[0] > df["timestamp"].iat[-1]:
+            df = df.iloc[::-1]
+        return df.reset_index(drop=True)
+    def start_kline_stream(self, callback, interval: str = "1", confirmed_only: bool = False):
         """
         Starts a WebSocket stream for real-time klines.
         :param callback: A function to handle the incoming data.
+        :param confirmed_only: Only forward closed candles (Bybit's confirm=true pushes).
         """
         ws = WebSocket(
-            testnet=self.testnet,
-            channel_type="linear",
+            **self._stream_kwargs(),
+            channel_type=self.category,
             api_key=self.api_key,
             api_secret=self.api_secret,
         )
@@ -398,13 +571,18 @@ class Client:
             
             # Format to match our DataFrame structure
             candle = data[0]
+            confirmed = bool(candle.get("confirm", False))
+            if confirmed_only and not confirmed:
+                return
             formatted_data = {
                 "timestamp": pd.to_datetime(int(candle["start"]), unit='ms'),
+                "start_time": int(candle["start"]),
                 "open": float(candle["open"]),
                 "high": float(candle["high"]),
                 "low": float(candle["low"]),
                 "close": float(candle["close"]),
-                "volume": float(candle["volume"])
+                "volume": float(candle["volume"]),
+                "confirm": confirmed
             }
             callback(formatted_data)
 
@@ -413,6 +591,82 @@ class Client:
             symbol=self.symbol,
             callback=handle_message
         )
+        return ws
+
+    def _stream_kwargs(self, private: bool = False) -> dict:
+        """
+        pybit WebSocket endpoint flags matching this client's REST environment.
+        Demo trading serves mainnet market data, so its public streams are the mainnet
+        ones; its private streams live on stream-demo (demo=True), not stream-testnet.
+        """
+        if self.endpoint_env == "demo":
+            return {"testnet": False, "demo": True} if private else {"testnet": False}
+        return {"testnet": self.testnet}
+
+    def start_order_stream(self, callback):
+        """
+        Starts the private WebSocket stream for order updates of the bound symbol.
+        :param callback: Receives a list of orders formatted like get_order_history().
+        """
+        ws = WebSocket(
+            **self._stream_kwargs(private=True),
+            channel_type="private",
+            api_key=self.api_key,
+            api_secret=self.api_secret,
+        )
+
+        def handle_message(msg):
+            data = msg.get("data", [])
+            orders = [self._format_order(o) for o in data if o.get("symbol") == self.symbol]
+            if orders:
+                callback(orders)
+
+        ws.order_stream(callback=handle_message)
+        return ws
+
+    def start_ticker_stream(self, callback):
+        """
+        Starts the public WebSocket ticker stream.
+        :param callback: Receives the last traded price as a float.
+        """
+        ws = WebSocket(
+            **self._stream_kwargs(),
+            channel_type=self.category,
+        )
+
+        def handle_message(msg):
+            # Linear tickers are pushed as deltas: lastPrice is absent when unchanged
+            last_price = msg.get("data", {}).get("lastPrice")
+            if last_price:
+                callback(float(last_price))
+
+        ws.ticker_stream(symbol=self.symbol, callback=handle_message)
+        return ws
+
+    def start_keepalive(self, interval: float = 20.0):
+        """
+        Pings /v5/market/time every `interval` seconds on a daemon thread.
+        The pybit session reuses one pooled HTTPS connection; regular traffic stops it
+        from idling out (NAT/firewall/server timeout), so orders skip a fresh TLS handshake.
+        """
+        if self._keepalive_stop is not None:
+            return
+        stop = threading.Event()
+
+        def ping():
+            while not stop.wait(interval):
+                try:
+                    self.session.get_server_time()
+                except Exception:
+                    pass  # The next order or ping simply reconnects
+
+        self._keepalive_stop = stop
+        threading.Thread(target=ping, name=f"{self.symbol}-keepalive", daemon=True).start()
+
+    def stop_keepalive(self):
+        if self._keepalive_stop is not None:
+            self._keepalive_stop.set()
+            self._keepalive_stop = None
 
     def is_connected(self):
         try:
@@ -32,6 +32,10 @@ class IContext(ABC):
         """Returns a list of active open orders."""
         pass
 
+    def has_pending_order(self, side: str) -> bool:
+        """True if an open order exists on `side` ('Buy' or 'Sell')."""
+        return any(o['side'] == side for o in self.pending_orders)
+
     @abstractmethod
     def log(self, message: str):
         pass
@@ -81,6 +85,13 @@ class LiveContext(IContext):
         self._ensure_sync()
         return self.client.get_open_position()
 
+    def subscribe_kline(self, interval: str, callback):
+        """
+        Streams closed candles of the client's symbol over WebSocket.
+        `callback` receives one dict per confirmed bar (start_time, OHLCV) on the socket thread.
+        """
+        return self.client.start_kline_stream(callback, interval=interval, confirmed_only=True)
+
     def log(self, message: str):
         print(f"[LIVE] {message}")
 
@@ -98,6 +109,7 @@ class BacktestContext(IContext):
         self.position = None 
         self.trades = []
         self._pending_orders = [] 
+        self._pending_count = {'Buy': 0, 'Sell': 0}  # Open limit orders per side
         self.current_price = 0.0
         self.current_time = None
 
@@ -116,6 +128,10 @@ class BacktestContext(IContext):
     def pending_orders(self) -> List[Dict]:
         return self._pending_orders
 
+    def has_pending_order(self, side: str) -> bool:
+        """O(1): per-side counters kept in step with the pending list."""
+        return self._pending_count[side] > 0
+
     def buy(self, qty: float, price: float = None, post_only: bool = False, reduce_only: bool = False, **kwargs):
         # 1. Post-Only Check
         if post_only and price and price >= self.current_price:
@@ -133,6 +149,7 @@ class BacktestContext(IContext):
                 'side': 'Buy', 'qty': qty, 'price': price, 
                 'post_only': post_only, 'reduce_only': reduce_only
             })
+            self._pending_count['Buy'] += 1
             return "BT_PENDING"
 
         # 4. Immediate Execution
@@ -156,6 +173,7 @@ class BacktestContext(IContext):
                 'side': 'Sell', 'qty': qty, 'price': price, 
                 'post_only': post_only, 'reduce_only': reduce_only
             })
+            self._pending_count['Sell'] += 1
             return "BT_PENDING"
 
         # 4. Immediate Execution
@@ -204,10 +222,12 @@ class BacktestContext(IContext):
                 self.log(f"LIMIT FILL: Buy {order['qty']} at {order['price']}")
                 self._execute_buy(order['qty'], order['price'], order['reduce_only'])
                 self._pending_orders.remove(order)
+                self._pending_count['Buy'] -= 1
             elif order['side'] == 'Sell' and candle['high'] >= order['price']:
                 self.log(f"LIMIT FILL: Sell {order['qty']} at {order['price']}")
                 self._execute_sell(order['qty'], order['price'], order['reduce_only'])
                 self._pending_orders.remove(order)
+                self._pending_count['Sell'] -= 1
 
     def _close_position(self, exit_price: float):
         if not self.position: return
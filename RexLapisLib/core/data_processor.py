@@ -1,31 +1,107 @@
 import pandas as pd
+import glob
 import os
 import time
 
+try:
+    import pyarrow.parquet as pq
+except ImportError:
+    # pyarrow is optional: without it the history is stored as CSV
+    pq = None
+
 class DataProcessor:
-    def __init__(self, symbol: str, storage_dir: str):
-        """Initializes storage path and ensures directory exists."""
+    # Parquet history: merge the part files into one once there are more than this
+    PARQUET_MAX_PARTS = 256
+
+    def __init__(self, symbol: str, storage_dir: str, storage_format: str = "csv"):
+        """
+        Initializes storage path and ensures directory exists.
+        storage_format="parquet" keeps the history as a directory of zstd-compressed
+        Parquet part files, one per save (typed columns, no text parsing on load);
+        it needs pyarrow, else CSV is used.
+        """
         self.symbol = symbol.upper()
+        if storage_format == "parquet" and pq is None:
+            print("pyarrow is not installed. Falling back to CSV storage.")
+            storage_format = "csv"
+        self.storage_format = storage_format
         os.makedirs(storage_dir, exist_ok=True)
-        self.storage_path = os.path.join(storage_dir, f"{self.symbol}_history.csv")
+        if storage_format == "parquet":
+            self.storage_path = os.path.join(storage_dir, f"{self.symbol}_history")
+        else:
+            self.storage_path = os.path.join(storage_dir, f"{self.symbol}_history.csv")
+        self._last_ts = None  # Last stored timestamp (ms), read from the file on the first save
+
+    def _parquet_parts(self) -> list:
+        """Part files of the Parquet history, oldest first (names carry the first timestamp)."""
+        return sorted(glob.glob(os.path.join(self.storage_path, "part-*.parquet")))
+
+    def _has_storage(self) -> bool:
+        if self.storage_format == "parquet":
+            return bool(self._parquet_parts())
+        return os.path.exists(self.storage_path)
+
+    def _read_storage(self) -> pd.DataFrame:
+        """Reads the whole history with a datetime timestamp column."""
+        if self.storage_format == "parquet":
+            parts = [pd.read_parquet(path) for path in self._parquet_parts()]
+            df = parts[0] if len(parts) == 1 else pd.concat(parts, ignore_index=True)
+            # A compaction interrupted before removing its merged parts leaves duplicates
+            return df.drop_duplicates(subset=['timestamp'], ignore_index=True)
+        df = pd.read_csv(self.storage_path)
+        df['timestamp'] = pd.to_datetime(df['timestamp'])
+        return df
 
     def save_to_csv(self, df: pd.DataFrame):
-        """Saves data to CSV with deduplication."""
-        if os.path.exists(self.storage_path):
-            existing_df = pd.read_csv(self.storage_path)
-            existing_df['timestamp'] = pd.to_datetime(existing_df['timestamp'])
-            df = pd.concat([existing_df, df]).drop_duplicates(subset=['timestamp'])
-        
-        df.sort_values("timestamp", inplace=True)
-        df.to_csv(self.storage_path, index=False)
+        """
+        Saves data to the history file (CSV or Parquet, see storage_format) with deduplication.
+        Append-only: rows at or before the last stored timestamp are treated as already
+        saved and skipped. CSV appends the newer rows; Parquet writes them as a new part
+        file, and merges the parts once there are more than PARQUET_MAX_PARTS.
+        """
+        if self._last_ts is None:
+            self._last_ts = self.get_last_timestamp()
+
+        ts_ms = pd.to_datetime(df['timestamp']).astype('datetime64[ms]').astype('int64')
+        df = df[ts_ms.to_numpy() > self._last_ts].drop_duplicates(subset=['timestamp'])
+        if df.empty:
+            print(f"File Up To Date: {self.storage_path}")
+            return
+        df = df.sort_values("timestamp")
+
+        if self.storage_format == "parquet":
+            self._write_part(df)
+            if len(self._parquet_parts()) > self.PARQUET_MAX_PARTS:
+                self._compact_parts()
+        elif not os.path.exists(self.storage_path):
+            df.to_csv(self.storage_path, index=False)
+        else:
+            header = pd.read_csv(self.storage_path, nrows=0).columns
+            df.reindex(columns=header).to_csv(self.storage_path, mode='a', header=False, index=False)
+
+        self._last_ts = int(ts_ms.max())
         print(f"File Synchronized: {self.storage_path}")
 
+    def _write_part(self, df: pd.DataFrame):
+        """Writes sorted rows as part-<first timestamp ms>.parquet (write-then-rename)."""
+        os.makedirs(self.storage_path, exist_ok=True)
+        first_ts = int(pd.Timestamp(df['timestamp'].iloc[0]).timestamp() * 1000)
+        path = os.path.join(self.storage_path, f"part-{first_ts:013d}.parquet")
+        tmp_path = path + ".tmp"
+        df.to_parquet(tmp_path, index=False, compression="zstd")
+        os.replace(tmp_path, path)
+
+    def _compact_parts(self):
+        """Merges every part into one file named after the oldest part."""
+        parts = self._parquet_parts()
+        self._write_part(self._read_storage())
+        for path in parts[1:]:
+            os.remove(path)
+
     def load_local_data(self) -> pd.DataFrame:
-        """Loads stored CSV data into a DataFrame. CRITICAL FOR VISUALIZER."""
-        if os.path.exists(self.storage_path):
-            df = pd.read_csv(self.storage_path)
-            df['timestamp'] = pd.to_datetime(df['timestamp'])
-            return df
+        """Loads stored history into a DataFrame. CRITICAL FOR VISUALIZER."""
+        if self._has_storage():
+            return self._read_storage()
         return pd.DataFrame()
 
     def resample_candles(self, df: pd.DataFrame, custom_interval: str):
@@ -40,13 +116,26 @@ class DataProcessor:
     
 
     def get_last_timestamp(self) -> int:
-        """Returns the last timestamp in the CSV in milliseconds."""
-        if not os.path.exists(self.storage_path):
+        """
+        Returns the last timestamp in the stored history in milliseconds.
+        Reads only the timestamp column; for Parquet the row-group statistics in the
+        newest part's footer answer it without decoding any data.
+        """
+        if not self._has_storage():
             return 0
-        df = pd.read_csv(self.storage_path)
-        if df.empty:
+        if self.storage_format == "parquet":
+            last_part = self._parquet_parts()[-1]
+            meta = pq.ParquetFile(last_part).metadata
+            ts_idx = meta.schema.names.index('timestamp')
+            stats = [meta.row_group(i).column(ts_idx).statistics for i in range(meta.num_row_groups)]
+            if stats and all(s is not None and s.has_min_max for s in stats):
+                return int(pd.Timestamp(max(s.max for s in stats)).timestamp() * 1000)
+            timestamps = pd.read_parquet(last_part, columns=['timestamp'])['timestamp']
+        else:
+            timestamps = pd.to_datetime(pd.read_csv(self.storage_path, usecols=['timestamp'])['timestamp'])
+        if timestamps.empty:
             return 0
-        return int(pd.to_datetime(df['timestamp']).max().timestamp() * 1000)
+        return int(timestamps.max().timestamp() * 1000)
 
     def sync_gap(self, client):
         """Fetches missing data between CSV last date and NOW."""
@@ -1,12 +1,35 @@
+import math
+from collections import deque
+from typing import Any, Dict, Mapping
+
 import pandas as pd
 import pandas_ta as ta
 import numpy as np
 
+from .kernels import _supertrend_loop
+
 class TechnicalEngine:
     """
     Independent Algorithmic Engine for technical indicators and market analysis.
     Separated from the UI to ensure logic can be used in live trading or backtesting.
     """
+    # Fixed indicator settings used by apply_all_indicators (and the streaming state)
+    RSI_LENGTH = 14
+    MACD_FAST, MACD_SLOW, MACD_SIGNAL = 12, 26, 9
+    BB_PERIOD, BB_STD = 20, 2
+    # Float indicator outputs (cast to float32 when float32=True)
+    INDICATOR_COLUMNS = ('atr', 'supertrend_line', 'rsi', 'macd', 'macd_signal', 'macd_hist',
+                         'bb_mid', 'bb_upper', 'bb_lower')
+
+    def __init__(self, float32: bool = False):
+        """
+        :param float32: Store indicator columns as float32 (half the memory and scan
+            bandwidth on long backtests). Computation and 'score' stay float64.
+        """
+        self.float32 = float32
+        # Running state for update_last(); created by reset_stream()/prime()
+        self._stream = None
+        self._stream_prev = None
 
     @staticmethod
     def apply_indicators(df: pd.DataFrame, atr_period=10, atr_mult=3.0):
@@ -94,10 +117,11 @@ class TechnicalEngine:
     @staticmethod
     def calculate_bollinger_bands(df: pd.DataFrame, period=20, std_dev=2):
         """Calculate Bollinger Bands"""
-        df['bb_mid'] = df['close'].rolling(window=period).mean()
-        df['bb_std'] = df['close'].rolling(window=period).std()
-        df['bb_upper'] = df['bb_mid'] + (df['bb_std'] * std_dev)
-        df['bb_lower'] = df['bb_mid'] - (df['bb_std'] * std_dev)
+        rolling = df['close'].rolling(window=period)
+        df['bb_mid'] = rolling.mean()
+        bb_std = rolling.std()
+        df['bb_upper'] = df['bb_mid'] + (bb_std * std_dev)
+        df['bb_lower'] = df['bb_mid'] - (bb_std * std_dev)
         return df
 
     @staticmethod
@@ -108,48 +132,23 @@ class TechnicalEngine:
         """
         hl2 = (df['high'] + df['low']) / 2
         
-        # ATR Calculation
-        df['tr0'] = abs(df['high'] - df['low'])
-        df['tr1'] = abs(df['high'] - df['close'].shift(1))
-        df['tr2'] = abs(df['low'] - df['close'].shift(1))
-        df['tr'] = df[['tr0', 'tr1', 'tr2']].max(axis=1)
-        df['atr'] = df['tr'].ewm(alpha=1/period, adjust=False).mean()
+        # ATR Calculation (True Range kept as a local array, never stored on df)
+        high = df['high'].values
+        low = df['low'].values
+        prev_close = df['close'].shift(1).values
+        # fmax skips the NaN of the first prev_close, like DataFrame.max(axis=1)
+        tr = np.fmax(high - low, np.fmax(np.abs(high - prev_close), np.abs(low - prev_close)))
+        df['atr'] = pd.Series(tr, index=df.index).ewm(alpha=1/period, adjust=False).mean()
 
         upper_basic = hl2 + (multiplier * df['atr'])
         lower_basic = hl2 - (multiplier * df['atr'])
 
-        close = df['close'].values
-        ub = upper_basic.values
-        lb = lower_basic.values
-        
-        upper_band = np.zeros(len(df))
-        lower_band = np.zeros(len(df))
-        supertrend = np.zeros(len(df), dtype=bool) 
-        trend_line = np.zeros(len(df))
+        close = df['close'].to_numpy(dtype=np.float64)
+        ub = upper_basic.to_numpy(dtype=np.float64)
+        lb = lower_basic.to_numpy(dtype=np.float64)
 
-        for i in range(1, len(df)):
-            # Final Upper Band Calculation
-            if ub[i] < upper_band[i-1] or close[i-1] > upper_band[i-1]:
-                upper_band[i] = ub[i]
-            else:
-                upper_band[i] = upper_band[i-1]
-
-            # Final Lower Band Calculation
-            if lb[i] > lower_band[i-1] or close[i-1] < lower_band[i-1]:
-                lower_band[i] = lb[i]
-            else:
-                lower_band[i] = lower_band[i-1]
-
-            # Trend Direction Logic
-            if supertrend[i-1] == True and close[i] <= lower_band[i]:
-                supertrend[i] = False
-            elif supertrend[i-1] == False and close[i] >= upper_band[i]:
-                supertrend[i] = True
-            else:
-                supertrend[i] = supertrend[i-1]
-                
-            # Set the visualization line
-            trend_line[i] = lower_band[i] if supertrend[i] else upper_band[i]
+        # Iterative band recursion runs in a compiled kernel (see kernels.py)
+        supertrend, trend_line = _supertrend_loop(close, ub, lb)
 
         df['supertrend_line'] = trend_line
         df['trend_direction'] = supertrend
@@ -187,4 +186,156 @@ class TechnicalEngine:
         df = self.calculate_macd(df)
         df = self.calculate_bollinger_bands(df)
         df['score'] = df.apply(self.analyze_market_sentiment, axis=1)
-        return df
\ No newline at end of file
+        return self._store_indicators(df)
+
+    def _store_indicators(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Applies the float32 storage option to the indicator columns."""
+        if self.float32:
+            for col in self.INDICATOR_COLUMNS:
+                df[col] = df[col].astype(np.float32)
+        return df
+
+    # ==================================================================
+    # STREAMING (INCREMENTAL) INDICATORS
+    # ==================================================================
+    @staticmethod
+    def _ewm_alpha(com: float) -> float:
+        # pandas converts span/alpha to a center of mass first; same rounding here
+        return 1. / (1. + com)
+
+    @staticmethod
+    def _ewm_step(state, x: float, alpha: float, adjust: bool):
+        """
+        Advances (weighted, old_wt, nobs) by one observation with the same float
+        operations as pandas' ewm kernel, so streaming values match the batch ones.
+        """
+        weighted, old_wt, nobs = state
+        if x != x:
+            return state
+        if weighted != weighted:
+            return (x, old_wt, nobs + 1)
+        old_wt *= 1. - alpha
+        new_wt = 1. if adjust else alpha
+        if weighted != x:
+            weighted = (old_wt * weighted + new_wt * x) / (old_wt + new_wt)
+        old_wt = old_wt + new_wt if adjust else 1.
+        return (weighted, old_wt, nobs + 1)
+
+    def reset_stream(self, atr_period: int = 10, atr_mult: float = 3.0):
+        """Clears the running indicator state consumed by update_last()."""
+        empty = (float('nan'), 1., 0)
+        self._stream = {
+            'atr_alpha': self._ewm_alpha(1. / (1. / atr_period) - 1.),
+            'atr_mult': atr_mult,
+            'bars': 0,
+            'prev_close': float('nan'),
+            'atr': empty,
+            'upper_band': 0.0,
+            'lower_band': 0.0,
+            'trend': False,
+            'gain': empty,
+            'loss': empty,
+            'ema_fast': empty,
+            'ema_slow': empty,
+            'macd_signal': empty,
+            'window': deque(maxlen=self.BB_PERIOD),
+        }
+        self._stream_prev = None
+
+    def update_last(self, row: Mapping[str, Any], amend: bool = False) -> Dict[str, Any]:
+        """
+        O(1) indicator update for one new candle (any mapping with high/low/close).
+        Returns the same values apply_all_indicators would put on that row.
+        amend=True replaces the previous update instead (e.g. a still-forming bar).
+        """
+        if self._stream is None:
+            self.reset_stream()
+        if amend and self._stream_prev is not None:
+            s = dict(self._stream_prev, window=deque(self._stream_prev['window'], maxlen=self.BB_PERIOD))
+        else:
+            s = self._stream
+            self._stream_prev = dict(s, window=deque(s['window'], maxlen=self.BB_PERIOD))
+        self._stream = s
+
+        high, low, close = float(row['high']), float(row['low']), float(row['close'])
+        prev_close = s['prev_close']
+        first = s['bars'] == 0
+
+        # --- SuperTrend: ATR (Wilder ewm of the True Range), then the band recursion ---
+        tr = high - low if first else max(high - low, abs(high - prev_close), abs(low - prev_close))
+        s['atr'] = self._ewm_step(s['atr'], tr, s['atr_alpha'], adjust=False)
+        atr = s['atr'][0]
+        if not first:
+            hl2 = (high + low) / 2
+            upper_basic = hl2 + (s['atr_mult'] * atr)
+            lower_basic = hl2 - (s['atr_mult'] * atr)
+            upper_prev, lower_prev = s['upper_band'], s['lower_band']
+            if upper_basic < upper_prev or prev_close > upper_prev:
+                s['upper_band'] = upper_basic
+            if lower_basic > lower_prev or prev_close < lower_prev:
+                s['lower_band'] = lower_basic
+            if s['trend'] and close <= s['lower_band']:
+                s['trend'] = False
+            elif not s['trend'] and close >= s['upper_band']:
+                s['trend'] = True
+        trend_line = 0.0 if first else (s['lower_band'] if s['trend'] else s['upper_band'])
+
+        # --- RSI (Wilder RMA of gains and losses, as pandas_ta) ---
+        rsi = float('nan')
+        if not first:
+            delta = close - prev_close
+            alpha = self._ewm_alpha(self.RSI_LENGTH - 1.)
+            s['gain'] = self._ewm_step(s['gain'], max(delta, 0.0), alpha, adjust=True)
+            s['loss'] = self._ewm_step(s['loss'], min(delta, 0.0), alpha, adjust=True)
+            if s['gain'][2] >= self.RSI_LENGTH:
+                gain, loss = s['gain'][0], abs(s['loss'][0])
+                rsi = 100 * gain / (gain + loss)
+
+        # --- MACD ---
+        s['ema_fast'] = self._ewm_step(s['ema_fast'], close, self._ewm_alpha((self.MACD_FAST - 1) / 2.), adjust=False)
+        s['ema_slow'] = self._ewm_step(s['ema_slow'], close, self._ewm_alpha((self.MACD_SLOW - 1) / 2.), adjust=False)
+        macd = s['ema_fast'][0] - s['ema_slow'][0]
+        s['macd_signal'] = self._ewm_step(s['macd_signal'], macd, self._ewm_alpha((self.MACD_SIGNAL - 1) / 2.), adjust=False)
+        macd_signal = s['macd_signal'][0]
+
+        # --- Bollinger Bands (window of the last BB_PERIOD closes) ---
+        window = s['window']
+        window.append(close)
+        bb_mid = bb_upper = bb_lower = float('nan')
+        if len(window) == self.BB_PERIOD:
+            bb_mid = math.fsum(window) / self.BB_PERIOD
+            bb_std = math.sqrt(math.fsum((x - bb_mid) ** 2 for x in window) / (self.BB_PERIOD - 1))
+            bb_upper = bb_mid + (bb_std * self.BB_STD)
+            bb_lower = bb_mid - (bb_std * self.BB_STD)
+
+        s['prev_close'] = close
+        s['bars'] += 1
+
+        values = {
+            'atr': atr,
+            'supertrend_line': trend_line,
+            'trend_direction': s['trend'],
+            'rsi': rsi,
+            'macd': macd,
+            'macd_signal': macd_signal,
+            'macd_hist': macd - macd_signal,
+            'bb_mid': bb_mid,
+            'bb_upper': bb_upper,
+            'bb_lower': bb_lower,
+        }
+        values['score'] = self.analyze_market_sentiment(dict(values, close=close))
+        return values
+
+    def prime(self, df: pd.DataFrame, atr_period=10, atr_mult=3.0) -> pd.DataFrame:
+        """
+        Resets the streaming state and replays `df` through update_last(), adding the
+        same indicator columns as apply_all_indicators. Later candles then only need
+        update_last().
+        """
+        self.reset_stream(atr_period, atr_mult)
+        if df.empty: return df
+        rows = [self.update_last(row) for row in df[['high', 'low', 'close']].to_dict('records')]
+        indicators = pd.DataFrame(rows, index=df.index)
+        for col in indicators.columns:
+            df[col] = indicators[col]
+        return self._store_indicators(df)
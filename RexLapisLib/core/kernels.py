@@ -0,0 +1,169 @@
+# RexLapisLib/core/kernels.py
+import math
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    # Numba is optional: without it the kernels run as plain Python/NumPy
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True, nogil=True)
+def _supertrend_loop(close, upper_basic, lower_basic):
+    """
+    Sequential SuperTrend band recursion.
+    Uses (t-1) values only, so it stays free of look-ahead bias.
+    No fastmath here: the branches compare floats and must match the pandas path exactly.
+    """
+    n = close.shape[0]
+    upper_band = np.zeros(n)
+    lower_band = np.zeros(n)
+    supertrend = np.zeros(n, dtype=np.bool_)
+    trend_line = np.zeros(n)
+
+    for i in range(1, n):
+        # Final Upper Band Calculation
+        if upper_basic[i] < upper_band[i-1] or close[i-1] > upper_band[i-1]:
+            upper_band[i] = upper_basic[i]
+        else:
+            upper_band[i] = upper_band[i-1]
+
+        # Final Lower Band Calculation
+        if lower_basic[i] > lower_band[i-1] or close[i-1] < lower_band[i-1]:
+            lower_band[i] = lower_basic[i]
+        else:
+            lower_band[i] = lower_band[i-1]
+
+        # Trend Direction Logic
+        if supertrend[i-1] and close[i] <= lower_band[i]:
+            supertrend[i] = False
+        elif not supertrend[i-1] and close[i] >= upper_band[i]:
+            supertrend[i] = True
+        else:
+            supertrend[i] = supertrend[i-1]
+
+        # Set the visualization line
+        trend_line[i] = lower_band[i] if supertrend[i] else upper_band[i]
+
+    return supertrend, trend_line
+
+
+@njit(cache=True, nogil=True)
+def _long_only_backtest(close, enter, exit_, start, balance, margin_leverage, fee_rate,
+                        risk, leverage, qty_decimals, min_qty, trades):
+    """
+    Candle replay of BacktestContext for market-order, long-only strategies.
+    Per row: enter when flat, else exit when long (the strategies' if/elif).
+    Sizing is (balance * risk) * leverage / close, optionally floored to qty_decimals.
+    trades is a preallocated (N, 4) buffer of [row, kind (1 = Buy, 0 = Close), price, qty or pnl].
+    Returns (balance, trade_count, qty, entry_price, margin_used); qty 0.0 means flat.
+    """
+    count = 0
+    qty = 0.0
+    entry = 0.0
+    margin = 0.0
+
+    for i in range(start, close.shape[0]):
+        price = close[i]
+
+        if enter[i] and qty == 0.0:
+            size = (balance * risk) * leverage / price
+            if qty_decimals >= 0:
+                scale = 10.0 ** qty_decimals
+                size = math.floor(size * scale) / scale
+            if size <= min_qty:
+                continue
+
+            total_value = size * price
+            required_margin = total_value / margin_leverage
+            total_cost = required_margin + total_value * fee_rate
+            if balance < total_cost:
+                continue  # Insufficient balance: the order is rejected
+
+            qty = size
+            entry = price
+            margin = required_margin
+            balance -= total_cost
+            trades[count, 0] = i
+            trades[count, 1] = 1.0
+            trades[count, 2] = price
+            trades[count, 3] = size
+            count += 1
+
+        elif exit_[i] and qty != 0.0:
+            net_pnl = (price - entry) * qty - (qty * price) * fee_rate
+            balance += margin + net_pnl
+            trades[count, 0] = i
+            trades[count, 1] = 0.0
+            trades[count, 2] = price
+            trades[count, 3] = net_pnl
+            count += 1
+            qty = 0.0
+            entry = 0.0
+            margin = 0.0
+
+    return balance, count, qty, entry, margin
+
+
+@njit(cache=True, nogil=True)
+def _grid_tick_plan(state, retry_after, target_entry, target_exit, offset_buy, offset_sell,
+                    price, now, pending_entry, placed_entry, filled_wait, placed_exit):
+    """
+    One pass over the executor pool for TradeManager.process_tick.
+    Partitions rows by state code, skips placements still backing off (retry_after > now)
+    and computes each placement's maker limit: the target, or just past a market beyond it.
+    Returns (entry_rows, entry_limits, tracked_entries, exit_rows, exit_limits, tracked_exits).
+    """
+    n = state.shape[0]
+    entry_rows = np.empty(n, dtype=np.int64)
+    entry_limits = np.empty(n)
+    tracked_entries = np.empty(n, dtype=np.int64)
+    exit_rows = np.empty(n, dtype=np.int64)
+    exit_limits = np.empty(n)
+    tracked_exits = np.empty(n, dtype=np.int64)
+    ne = nte = nx = ntx = 0
+
+    for i in range(n):
+        code = state[i]
+        if code == pending_entry:
+            if retry_after[i] <= now:
+                target = target_entry[i]
+                entry_rows[ne] = i
+                entry_limits[ne] = price - offset_buy[i] if price < target else target
+                ne += 1
+        elif code == placed_entry:
+            tracked_entries[nte] = i
+            nte += 1
+        elif code == filled_wait:
+            if retry_after[i] <= now:
+                target = target_exit[i]
+                exit_rows[nx] = i
+                exit_limits[nx] = price + offset_sell[i] if price > target else target
+                nx += 1
+        elif code == placed_exit:
+            tracked_exits[ntx] = i
+            ntx += 1
+
+    return (entry_rows[:ne], entry_limits[:ne], tracked_entries[:nte],
+            exit_rows[:nx], exit_limits[:nx], tracked_exits[:ntx])
+
+
+def _warmup():
+    """
+    Runs every kernel once on a tiny input at import time.
+    With cache=True this is a cache load; on a clean environment it moves the
+    JIT compile to startup instead of the first live tick or backtest candle.
+    """
+    ones = np.ones(4)
+    flags = np.zeros(4, dtype=np.bool_)
+    _supertrend_loop(ones, ones, ones)
+    _long_only_backtest(ones, flags, flags, 0, 1.0, 1.0, 0.0, 1.0, 1.0, -1, 0.0, np.empty((4, 4)))
+    _grid_tick_plan(np.zeros(4, dtype=np.int8), ones, ones, ones, ones, ones, 1.0, 1.0, 0, 1, 2, 3)
+    return True
+
+
+_warmup()
@@ -1,9 +1,29 @@
 import os
+import sys
+import time
+import random
+import atexit
+import queue
 import logging
+import logging.handlers
 import json
+import pickle
+import threading
+import zlib
 import numpy as np
-from scipy.stats import norm
-from typing import List, Dict, Set, Optional, Any
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from types import MappingProxyType
+from scipy.special import ndtri
+
+from .kernels import _grid_tick_plan
+from typing import List, Dict, FrozenSet, Mapping, NamedTuple, Optional, Any
+
+try:
+    import orjson
+except ImportError:
+    # orjson is optional: persistence falls back to the stdlib json module
+    orjson = None
 
 # Relative import from the models sub-package
 # Ensure this path exists in your project, otherwise replace with direct Enum definition
@@ -29,143 +49,449 @@ ops_logger = logging.getLogger("OPS")
 ops_logger.setLevel(logging.DEBUG)
 ops_handler = logging.FileHandler("./results/ops.log")
 ops_handler.setFormatter(file_formatter)
-ops_logger.addHandler(ops_handler)
 
 pnl_logger = logging.getLogger("PNL")
 pnl_logger.setLevel(logging.INFO)
 pnl_handler = logging.FileHandler("./results/pnl.log")
 pnl_handler.setFormatter(file_formatter)
-pnl_logger.addHandler(pnl_handler)
+
+def _attach_queue_listener(logger: logging.Logger, handler: logging.Handler) -> logging.handlers.QueueListener:
+    """Routes the logger through an in-process queue; a background listener owns the file handler."""
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    listener = logging.handlers.QueueListener(log_queue, handler, respect_handler_level=True)
+    listener.start()
+    # Flush what is still queued on interpreter exit
+    atexit.register(listener.stop)
+    return listener
+
+# The tick thread only enqueues records; file writes happen off the hot path
+ops_listener = _attach_queue_listener(ops_logger, ops_handler)
+pnl_listener = _attach_queue_listener(pnl_logger, pnl_handler)
 
 # ==========================================
-# 2. PositionExecutor Class (UNTOUCHED)
+# 2. Order Records & ExecutorPool (Structure-of-Arrays Storage)
+# ==========================================
+class OrderRecord(NamedTuple):
+    """The slice of an order the executors read; built once when orders are ingested."""
+    order_id: str
+    status: str
+    avg_price: Optional[float] = None
+
+    @classmethod
+    def from_order(cls, order: Dict[str, Any]) -> 'OrderRecord':
+        """Converts a Client order dict (REST or stream) into a record."""
+        return cls(sys.intern(order['order_id']), order.get('status', ''), order.get('avg_price'))
+
+
+# Integer codes for the int8 state column
+_STATES = tuple(ExecutorState)
+_STATE_CODES = {state: code for code, state in enumerate(_STATES)}
+_PENDING_ENTRY = _STATE_CODES[ExecutorState.PENDING_ENTRY]
+_PLACED_ENTRY = _STATE_CODES[ExecutorState.PLACED_ENTRY]
+_FILLED_WAIT = _STATE_CODES[ExecutorState.FILLED_WAIT]
+_PLACED_EXIT = _STATE_CODES[ExecutorState.PLACED_EXIT]
+_COMPLETED = _STATE_CODES[ExecutorState.COMPLETED]
+
+def _parse_state(value: Any) -> ExecutorState:
+    """Handles State Enum reconstruction safely (by value, then by name, else PENDING_ENTRY)."""
+    try:
+        return ExecutorState(value)
+    except ValueError:
+        # Fallback if string doesn't match enum exactly
+        return ExecutorState[value] if value in ExecutorState.__members__ else ExecutorState.PENDING_ENTRY
+
+class ExecutorPool:
+    """
+    Column storage for executor fields: one contiguous NumPy array per field.
+    Row i belongs to the executor whose idx is i; PositionExecutors are thin views on it.
+    """
+    FLOAT_FIELDS = ('target_entry', 'target_exit', 'qty', 'maker_offset_buy', 'maker_offset_sell',
+                    'entry_fill_price', 'exit_fill_price')
+    COLUMNS = FLOAT_FIELDS + ('loop_trade', 'state', 'retry_count', 'retry_after')
+    # Keys of PositionExecutor.to_dict(), in order
+    RECORD_FIELDS = ('target_entry', 'target_exit', 'qty', 'maker_offset_buy', 'maker_offset_sell',
+                     'loop_trade', 'state', 'active_order_id', 'entry_fill_price')
+
+    def __init__(self, capacity: int = 16):
+        capacity = max(int(capacity), 1)
+        self.size = 0
+        for name in self.FLOAT_FIELDS:
+            setattr(self, name, np.zeros(capacity, dtype=np.float64))
+        self.loop_trade = np.zeros(capacity, dtype=np.bool_)
+        self.state = np.zeros(capacity, dtype=np.int8)
+        # Placement backoff: consecutive rejects and the monotonic time of the next attempt
+        self.retry_count = np.zeros(capacity, dtype=np.int32)
+        self.retry_after = np.zeros(capacity, dtype=np.float64)
+        # Order IDs are strings, kept in a parallel list
+        self.active_order_id: List[Optional[str]] = []
+        # Bumped whenever rows are renumbered (compact), so row-indexed deltas know to resnapshot
+        self.layout = 0
+
+    @property
+    def capacity(self) -> int:
+        return self.state.shape[0]
+
+    def reserve(self, extra: int):
+        """Grows every column (amortized doubling) so `extra` more rows fit."""
+        needed = self.size + extra
+        if needed <= self.capacity:
+            return
+        new_capacity = max(needed, 2 * self.capacity)
+        for name in self.COLUMNS:
+            column = getattr(self, name)
+            grown = np.zeros(new_capacity, dtype=column.dtype)
+            grown[:self.size] = column[:self.size]
+            setattr(self, name, grown)
+
+    def append(self, target_entry: float, target_exit: float, qty: float,
+               maker_offset_buy: float, maker_offset_sell: float, loop_trade: bool = False) -> int:
+        """Adds a fresh PENDING_ENTRY row and returns its index."""
+        self.reserve(1)
+        i = self.size
+        self.target_entry[i] = target_entry
+        self.target_exit[i] = target_exit
+        self.qty[i] = qty
+        self.maker_offset_buy[i] = maker_offset_buy
+        self.maker_offset_sell[i] = maker_offset_sell
+        self.entry_fill_price[i] = 0.0
+        self.exit_fill_price[i] = 0.0
+        self.loop_trade[i] = loop_trade
+        self.state[i] = _STATE_CODES[ExecutorState.PENDING_ENTRY]
+        self.retry_count[i] = 0
+        self.retry_after[i] = 0.0
+        self.active_order_id.append(None)
+        self.size += 1
+        return i
+
+    def to_records(self, rows: Optional[np.ndarray] = None) -> List[Dict[str, Any]]:
+        """
+        Same output as [executor.to_dict() ...], built from one tolist() per column.
+        `rows` limits it to those row indices.
+        """
+        index = slice(0, self.size) if rows is None else rows
+        order_ids = self.active_order_id if rows is None else [self.active_order_id[i] for i in rows.tolist()]
+        states = [_STATES[code].value for code in self.state[index].tolist()]
+        columns = [getattr(self, name)[index].tolist() for name in self.RECORD_FIELDS[:6]]
+        columns += [states, order_ids, self.entry_fill_price[index].tolist()]
+        return [dict(zip(self.RECORD_FIELDS, row)) for row in zip(*columns)]
+
+    def apply_delta(self, size: int, rows: Dict[int, Dict[str, Any]]):
+        """Replays one save_delta() entry: grows to `size` rows, then overwrites `rows` from their records."""
+        if size > self.size:
+            self.reserve(size - self.size)
+            added = slice(self.size, size)
+            for name in self.COLUMNS:
+                getattr(self, name)[added] = 0
+            self.active_order_id.extend([None] * (size - self.size))
+            self.size = size
+        for i, record in rows.items():
+            for name in self.FLOAT_FIELDS[:5]:
+                getattr(self, name)[i] = record[name]
+            self.loop_trade[i] = record.get("loop_trade", False)
+            self.state[i] = _STATE_CODES[_parse_state(record["state"])]
+            self.entry_fill_price[i] = record.get("entry_fill_price", 0.0)
+            order_id = record["active_order_id"]
+            self.active_order_id[i] = sys.intern(order_id) if order_id is not None else None
+
+    @classmethod
+    def from_records(cls, records: List[Dict[str, Any]]) -> 'ExecutorPool':
+        """Bulk counterpart of PositionExecutor.from_dict: fills each column in one assignment."""
+        n = len(records)
+        pool = cls(n)
+        for name in cls.FLOAT_FIELDS[:5]:
+            getattr(pool, name)[:n] = [record[name] for record in records]
+        pool.loop_trade[:n] = [record.get("loop_trade", False) for record in records]
+        pool.state[:n] = [_STATE_CODES[_parse_state(record["state"])] for record in records]
+        pool.entry_fill_price[:n] = [record.get("entry_fill_price", 0.0) for record in records]
+        pool.active_order_id = [
+            sys.intern(order_id) if order_id is not None else None
+            for order_id in (record["active_order_id"] for record in records)
+        ]
+        pool.size = n
+        return pool
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Pickle only the live rows, not the spare capacity
+        state = {name: getattr(self, name)[:self.size] for name in self.COLUMNS}
+        state['active_order_id'] = self.active_order_id
+        state['size'] = self.size
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]):
+        self.__dict__.update(state)
+        self.layout = 0
+        # Snapshots written before a column existed restore it zeroed
+        missing = [name for name in self.COLUMNS if name not in state]
+        if missing:
+            fresh = ExecutorPool(self.size)
+            for name in missing:
+                setattr(self, name, getattr(fresh, name))
+
+    def extend(self, target_entry: np.ndarray, target_exit: np.ndarray, qty: float,
+               maker_offset_buy: float, maker_offset_sell: float, loop_trade: bool = False) -> range:
+        """Adds len(target_entry) PENDING_ENTRY rows with slice assignments; returns their indices."""
+        n = len(target_entry)
+        self.reserve(n)
+        start, end = self.size, self.size + n
+        self.target_entry[start:end] = target_entry
+        self.target_exit[start:end] = target_exit
+        self.qty[start:end] = qty
+        self.maker_offset_buy[start:end] = maker_offset_buy
+        self.maker_offset_sell[start:end] = maker_offset_sell
+        self.entry_fill_price[start:end] = 0.0
+        self.exit_fill_price[start:end] = 0.0
+        self.loop_trade[start:end] = loop_trade
+        self.state[start:end] = _PENDING_ENTRY
+        self.retry_count[start:end] = 0
+        self.retry_after[start:end] = 0.0
+        self.active_order_id.extend([None] * n)
+        self.size = end
+        return range(start, end)
+
+    def compact(self, keep: np.ndarray):
+        """Drops the rows where `keep` is False; the remaining rows keep their order."""
+        n = self.size
+        kept = int(np.count_nonzero(keep))
+        for name in self.COLUMNS:
+            column = getattr(self, name)
+            column[:kept] = column[:n][keep]
+        self.active_order_id = [oid for oid, k in zip(self.active_order_id, keep.tolist()) if k]
+        self.size = kept
+        self.layout += 1
+
+
+class _PoolField:
+    """Maps an executor attribute onto its row in the pool column of the same name."""
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, executor, owner=None):
+        if executor is None:
+            return self
+        value = getattr(executor.pool, self.name)[executor.idx]
+        # Hand out plain Python scalars, as the attributes were before pooling
+        return value.item() if isinstance(value, np.generic) else value
+
+    def __set__(self, executor, value):
+        getattr(executor.pool, self.name)[executor.idx] = value
+
+
+class _PoolStateField(_PoolField):
+    """The state column stores int8 codes; the attribute exposes ExecutorState."""
+    def __get__(self, executor, owner=None):
+        if executor is None:
+            return self
+        return _STATES[executor.pool.state[executor.idx]]
+
+    def __set__(self, executor, value):
+        executor.pool.state[executor.idx] = _STATE_CODES[ExecutorState(value)]
+
+
+# ==========================================
+# 3. PositionExecutor Class
 # ==========================================
 class PositionExecutor:
     """
     Manages the lifecycle of a single trade:
     PENDING -> PLACED_ENTRY -> FILLED_WAIT -> PLACED_EXIT -> COMPLETED.
+    Fields live in a row of an ExecutorPool; the executor only holds (client, pool, idx).
     """
+    __slots__ = ('client', 'pool', 'idx')
 
-    def __init__(
-        self, 
-        client: Any, 
-        target_entry: float, 
-        target_exit: float, 
-        qty: float, 
-        maker_offset_buy: float, 
-        maker_offset_sell: float,
-        loop_trade: bool = False
-    ):
+    target_entry = _PoolField()
+    target_exit = _PoolField()
+    qty = _PoolField()
+    maker_offset_buy = _PoolField()
+    maker_offset_sell = _PoolField()
+    loop_trade = _PoolField()
+
+    # Operational State
+    state = _PoolStateField()
+    active_order_id = _PoolField()
+
+    # Performance Tracking
+    entry_fill_price = _PoolField()
+    exit_fill_price = _PoolField()
+
+    # Placement backoff (monotonic clock, so never persisted to JSON)
+    retry_count = _PoolField()
+    retry_after = _PoolField()
+
+    # Rejected placements wait RETRY_BASE * 2**n seconds (capped) plus up to RETRY_JITTER
+    RETRY_BASE = 0.25
+    RETRY_CAP = 2.0
+    RETRY_JITTER = 0.1
+    RETRY_MAX_EXPONENT = 16
+
+    def __init__(self, client: Any, target_entry: float, target_exit: float, qty: float,
+                 maker_offset_buy: float, maker_offset_sell: float, loop_trade: bool = False,
+                 pool: Optional[ExecutorPool] = None):
         self.client = client
-        self.target_entry = target_entry
-        self.target_exit = target_exit
-        self.qty = qty
-        self.maker_offset_buy = maker_offset_buy
-        self.maker_offset_sell = maker_offset_sell
-        self.loop_trade = loop_trade
+        # A standalone executor gets a private single-row pool
+        self.pool = pool if pool is not None else ExecutorPool(1)
+        self.idx = self.pool.append(target_entry, target_exit, qty, maker_offset_buy, maker_offset_sell, loop_trade)
 
-        # Operational State
-        self.state: ExecutorState = ExecutorState.PENDING_ENTRY
-        self.active_order_id: Optional[str] = None
-        
-        # Performance Tracking
-        self.entry_fill_price: float = 0.0
-        self.exit_fill_price: float = 0.0
+    @classmethod
+    def view(cls, client: Any, pool: ExecutorPool, idx: int) -> 'PositionExecutor':
+        """Binds an executor to an existing pool row without appending a new one."""
+        instance = cls.__new__(cls)
+        instance.client = client
+        instance.pool = pool
+        instance.idx = idx
+        return instance
+
+    def __repr__(self) -> str:
+        return (f"PositionExecutor(target_entry={self.target_entry}, target_exit={self.target_exit}, "
+                f"qty={self.qty}, state={self.state.value}, active_order_id={self.active_order_id})")
+
+    def move_to(self, pool: ExecutorPool):
+        """Copies this executor's row into `pool` and rebinds the view to the new row."""
+        idx = pool.append(self.target_entry, self.target_exit, self.qty,
+                          self.maker_offset_buy, self.maker_offset_sell, self.loop_trade)
+        pool.state[idx] = self.pool.state[self.idx]
+        pool.active_order_id[idx] = self.active_order_id
+        pool.entry_fill_price[idx] = self.entry_fill_price
+        pool.exit_fill_price[idx] = self.exit_fill_price
+        pool.retry_count[idx] = self.retry_count
+        pool.retry_after[idx] = self.retry_after
+        self.pool, self.idx = pool, idx
 
     def execute_cycle(
         self, 
         current_price: float, 
-        open_order_ids: Set[str], 
-        order_history_map: Dict[str, Any]
+        open_order_ids: FrozenSet[str], 
+        order_history_map: Mapping[str, OrderRecord],
+        order_queue: Optional[List] = None
     ) -> ExecutorState:
-        """Processes a single heartbeat for this specific trade."""
+        """
+        Processes a single heartbeat for this specific trade.
+        `order_history_map` maps order IDs to OrderRecords (see OrderRecord.from_order).
+        If `order_queue` is given, new orders are appended to it as (executor, request)
+        instead of being sent; the caller submits them and reports back via on_order_result().
+        Single-row form of TradeManager.process_tick: the same _grid_tick_plan picks the
+        step (honouring the retry backoff) and the maker limit price.
+        """
         
-        # --- PHASE A: ENTRY (BUYING) ---
-        if self.state == ExecutorState.PENDING_ENTRY:
-            limit_price = self.target_entry
-            # Adjust limit price to ensure we stay as a Maker
-            if current_price < self.target_entry:
-                limit_price = current_price - self.maker_offset_buy
-            
-            try:
-                self.active_order_id = self.client.place_limit_order(
-                    side="Buy",
-                    qty=self.qty,
-                    price=limit_price,
-                    reduce_only=False,
-                    post_only=True 
-                )
-                ops_logger.info(f"Entry Placed | ID: {self.active_order_id}")
-                self.state = ExecutorState.PLACED_ENTRY
-            except Exception as e:
-                ops_logger.warning(f"Entry placement failed (likely PostOnly collision): {e}")
-
-        elif self.state == ExecutorState.PLACED_ENTRY:
-            if self.active_order_id not in open_order_ids:
-                order_data = order_history_map.get(self.active_order_id)
-                if order_data:
-                    status = order_data.get('status', '')
-                    if status == 'Filled':
-                        ops_logger.info(f"Entry Order {self.active_order_id} filled.")
-                        self.entry_fill_price = float(order_data.get('avg_price', self.target_entry))
-                        self.active_order_id = None
-                        self.state = ExecutorState.FILLED_WAIT
-                    elif status in ['Cancelled', 'Rejected', 'Deactivated']:
-                        self.active_order_id = None
+        row = slice(self.idx, self.idx + 1)
+        pool = self.pool
+        (place_entry, entry_limits, track_entry,
+         place_exit, exit_limits, track_exit) = _grid_tick_plan(
+            pool.state[row], pool.retry_after[row], pool.target_entry[row], pool.target_exit[row],
+            pool.maker_offset_buy[row], pool.maker_offset_sell[row], float(current_price), time.monotonic(),
+            _PENDING_ENTRY, _PLACED_ENTRY, _FILLED_WAIT, _PLACED_EXIT
+        )
+        if len(place_entry):
+            self._submit(self.order_request("Buy", float(entry_limits[0])), order_queue)
+        elif len(track_entry):
+            self._track_entry(open_order_ids, order_history_map)
+        elif len(place_exit):
+            self._submit(self.order_request("Sell", float(exit_limits[0])), order_queue)
+        elif len(track_exit):
+            self._track_exit(open_order_ids, order_history_map)
+        return self.state
+
+    # --- PHASE A: ENTRY (BUYING) ---
+
+    def _track_entry(self, open_order_ids: FrozenSet[str], order_history_map: Mapping[str, OrderRecord]):
+        if self.active_order_id not in open_order_ids:
+            order_data = order_history_map.get(self.active_order_id)
+            if order_data:
+                status = order_data.status
+                if status == 'Filled':
+                    ops_logger.info("Entry Order %s filled.", self.active_order_id)
+                    avg_price = order_data.avg_price
+                    self.entry_fill_price = float(avg_price if avg_price is not None else self.target_entry)
+                    self.active_order_id = None
+                    self.state = ExecutorState.FILLED_WAIT
+                elif status in ['Cancelled', 'Rejected', 'Deactivated']:
+                    self.active_order_id = None
+                    self.state = ExecutorState.PENDING_ENTRY
+
+    # --- PHASE B: EXIT (SELLING) ---
+
+    def _track_exit(self, open_order_ids: FrozenSet[str], order_history_map: Mapping[str, OrderRecord]):
+        if self.active_order_id not in open_order_ids:
+            order_data = order_history_map.get(self.active_order_id)
+            if order_data:
+                status = order_data.status
+                if status == 'Filled':
+                    ops_logger.info("Exit Order %s filled. Trade Complete.", self.active_order_id)
+                    avg_price = order_data.avg_price
+                    self.exit_fill_price = float(avg_price if avg_price is not None else self.target_exit)
+                    self._log_pnl()
+
+                    if self.loop_trade:
                         self.state = ExecutorState.PENDING_ENTRY
+                        self.active_order_id = None
+                        self.entry_fill_price = 0.0
+                        self.exit_fill_price = 0.0
+                    else:
+                        self.state = ExecutorState.COMPLETED
+                elif status in ['Cancelled', 'Rejected', 'Deactivated']:
+                    self.active_order_id = None
+                    self.state = ExecutorState.FILLED_WAIT
 
-        # --- PHASE B: EXIT (SELLING) ---
-        elif self.state == ExecutorState.FILLED_WAIT:
-            limit_price = self.target_exit
-            if current_price > self.target_exit:
-                limit_price = current_price + self.maker_offset_sell
-                
-            try:
-                self.active_order_id = self.client.place_limit_order(
-                    side="Sell",
-                    qty=self.qty,
-                    price=limit_price,
-                    reduce_only=True,
-                    post_only=True
-                )
-                ops_logger.info(f"Exit Placed | ID: {self.active_order_id}")
-                self.state = ExecutorState.PLACED_EXIT
-            except Exception as e:
+    def order_request(self, side: str, limit_price: float) -> Dict[str, Any]:
+        """Builds the post-only limit order for the current phase (Buy = entry, Sell = exit)."""
+        return {
+            "side": side,
+            "qty": self.qty,
+            "price": limit_price,
+            "reduce_only": side == "Sell",
+            "post_only": True
+        }
+
+    def _submit(self, request: Dict[str, Any], order_queue: Optional[List]):
+        if order_queue is not None:
+            order_queue.append((self, request))
+            return
+        try:
+            result = self.client.place_limit_order(**request)
+        except Exception as e:
+            result = e
+        self.on_order_result(request, result)
+
+    def on_order_result(self, request: Dict[str, Any], result: Any):
+        """Applies a placement outcome: an order ID on success, or the raised Exception."""
+        failed = isinstance(result, Exception)
+
+        if request["side"] == "Buy":
+            if failed:
+                ops_logger.warning("Entry placement failed (likely PostOnly collision): %s", result)
+                self._back_off()
+                return
+            self.retry_count = 0
+            self.active_order_id = sys.intern(str(result))
+            ops_logger.info("Entry Placed | ID: %s", result)
+            self.state = ExecutorState.PLACED_ENTRY
+        else:
+            if failed:
                 # Handle cases where the position was closed manually or incorrectly
-                if "110017" in str(e) or "reduceOnly" in str(e):
+                if "110017" in str(result) or "reduceOnly" in str(result):
                     ops_logger.warning("Reduce-only error: Entry likely cancelled. Resetting.")
                     self.state = ExecutorState.PENDING_ENTRY
                     self.active_order_id = None
                 else:
-                    ops_logger.warning(f"Exit placement failed: {e}")
-
-        elif self.state == ExecutorState.PLACED_EXIT:
-            if self.active_order_id not in open_order_ids:
-                order_data = order_history_map.get(self.active_order_id)
-                if order_data:
-                    status = order_data.get('status', '')
-                    if status == 'Filled':
-                        ops_logger.info(f"Exit Order {self.active_order_id} filled. Trade Complete.")
-                        self.exit_fill_price = float(order_data.get('avg_price', self.target_exit))
-                        self._log_pnl()
-                        
-                        if self.loop_trade:
-                            self.state = ExecutorState.PENDING_ENTRY
-                            self.active_order_id = None
-                            self.entry_fill_price = 0.0
-                            self.exit_fill_price = 0.0
-                        else:
-                            self.state = ExecutorState.COMPLETED
-                    elif status in ['Cancelled', 'Rejected', 'Deactivated']:
-                        self.active_order_id = None
-                        self.state = ExecutorState.FILLED_WAIT
+                    ops_logger.warning("Exit placement failed: %s", result)
+                    self._back_off()
+                return
+            self.retry_count = 0
+            self.active_order_id = sys.intern(str(result))
+            ops_logger.info("Exit Placed | ID: %s", result)
+            self.state = ExecutorState.PLACED_EXIT
 
-        return self.state
+    def _back_off(self):
+        """Delays this executor's next placement with capped exponential backoff plus jitter."""
+        count = min(self.retry_count + 1, self.RETRY_MAX_EXPONENT)
+        self.retry_count = count
+        delay = min(self.RETRY_BASE * 2 ** (count - 1), self.RETRY_CAP)
+        self.retry_after = time.monotonic() + delay + random.random() * self.RETRY_JITTER
 
     def _log_pnl(self):
         """Calculates and logs the PnL of the completed cycle."""
         pnl = (self.exit_fill_price - self.entry_fill_price) * self.qty
-        pnl_logger.info(f"CLOSED | Entry: {self.entry_fill_price} | Exit: {self.exit_fill_price} | PnL: {pnl:.4f} USDT")
+        pnl_logger.info("CLOSED | Entry: %s | Exit: %s | PnL: %.4f USDT", self.entry_fill_price, self.exit_fill_price, pnl)
 
     def to_dict(self) -> Dict[str, Any]:
         """Serializes the executor for JSON storage or Web API."""
@@ -193,33 +519,87 @@ class PositionExecutor:
             maker_offset_sell=data["maker_offset_sell"],
             loop_trade=data.get("loop_trade", False)
         )
-        # Handle State Enum reconstruction safely
-        state_val = data["state"]
-        try:
-            instance.state = ExecutorState(state_val)
-        except ValueError:
-            # Fallback if string doesn't match enum exactly
-            instance.state = ExecutorState[state_val] if state_val in ExecutorState.__members__ else ExecutorState.PENDING_ENTRY
-            
-        instance.active_order_id = data["active_order_id"]
+        instance.state = _parse_state(data["state"])
+        order_id = data["active_order_id"]
+        instance.active_order_id = sys.intern(order_id) if order_id is not None else None
         instance.entry_fill_price = data.get("entry_fill_price", 0.0)
         return instance
 
 # ==========================================
-# 3. TradeManager Class (UPDATED FOR RESILIENCE)
+# 4. TradeManager Class (UPDATED FOR RESILIENCE)
 # ==========================================
 class TradeManager:
     """
     Orchestrates multiple PositionExecutors AND handles single strategy persistence.
     Compatible with both Grid Bots and Single-Strategy Bots (run_live.py).
     """
-    def __init__(self, client: Any, state_file: str = "trader_state.json", maker_offset_buy: float = 0.0, maker_offset_sell: float = 0.0):
+    # Order statuses that keep an order on the book
+    OPEN_ORDER_STATUSES = ('New', 'PartiallyFilled', 'Untriggered')
+    # Order records kept for fill detection; the least recently updated are evicted past this
+    HISTORY_CACHE_SIZE = 4000
+    # save_state() writes are coalesced: at most one per interval (seconds)
+    SAVE_INTERVAL = 5.0
+    # save_delta(): full snapshot (and log reset) every N deltas; fsync the log every M appends
+    DELTA_SNAPSHOT_EVERY = 1000
+    DELTA_FSYNC_EVERY = 20
+
+    def __init__(self, client: Any, state_file: str = "trader_state.json", maker_offset_buy: float = 0.0, maker_offset_sell: float = 0.0, use_websocket: bool = False, batch_orders: bool = False):
         self.client = client
         self.state_file = state_file
         self.maker_offset_buy = maker_offset_buy
         self.maker_offset_sell = maker_offset_sell
-        self.executors: List[PositionExecutor] = []
+        # Executor fields live in one shared pool; self.executors[i] views row i
+        self.pool = ExecutorPool()
+        self._executors: List[PositionExecutor] = []
+
+        # Collect each tick's new orders and send them through the batch endpoint
+        self.batch_orders = batch_orders and hasattr(client, 'place_batch_limit_orders')
+
+        # WebSocket-fed caches (only used when streaming is enabled)
+        self._streaming = False
+        self._stream_lock = threading.Lock()
+        self._current_price: Optional[float] = None
+        self._open_order_ids: FrozenSet[str] = frozenset()
+        self._order_history_map: Dict[str, OrderRecord] = OrderedDict()
+        # Read-only live view handed to executors, so they cannot mutate the cache
+        self._order_history_view: Mapping[str, OrderRecord] = MappingProxyType(self._order_history_map)
+        # Bumped on every order event; process_tick remembers the last version it acted on
+        self._order_version = 0
+        self._seen_version = -1
+        # Set by stream events so a live driver can wait for data (see wait_for_update)
+        self._update_event = threading.Event()
+
+        # Coalesced save_state(): the latest state waits for the background writer
+        self._save_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._pending_state: Optional[Dict[str, Any]] = None
+        self._dirty = False
+        self._saver: Optional[threading.Thread] = None
+
+        # save_delta(): persisted columns as of the last delta, and deltas since the snapshot
+        self._delta_base: Optional[Dict[str, Any]] = None
+        self._delta_count = 0
+        # save_delta() file writes run on one background thread, overlapping the next tick
+        self._io: Optional[ThreadPoolExecutor] = None
+        self._io_pending: Optional[Future] = None
+
         ops_logger.info(f"TradeManager Initialized. Persistence File: {self.state_file}")
+        if use_websocket:
+            self.start_streams()
+
+    @property
+    def executors(self) -> List[PositionExecutor]:
+        return self._executors
+
+    @executors.setter
+    def executors(self, executors: List[PositionExecutor]):
+        """Adopts the given executors into a fresh pool, rows following list order."""
+        pool = ExecutorPool(len(executors))
+        for executor in executors:
+            executor.move_to(pool)
+        self.pool = pool
+        self._executors = list(executors)
+        self._seen_version = -1
 
     # --- Original Grid Logic Methods (Preserved) ---
 
@@ -231,9 +611,10 @@ class TradeManager:
             qty=qty,
             maker_offset_buy=self.maker_offset_buy,
             maker_offset_sell=self.maker_offset_sell,
-            loop_trade=loop_trade
+            loop_trade=loop_trade,
+            pool=self.pool
         )
-        self.executors.append(executor)
+        self._executors.append(executor)
 
     def create_linear_traders(self, min_p: float, max_p: float, count: int, qty: float, profit: float, loop: bool = False):
         """Generates trades at equally spaced price intervals."""
@@ -245,16 +626,97 @@ class TradeManager:
         loc = mean if mean is not None else (min_p + max_p) / 2
         scale = (max_p - min_p) / sigma
         probabilities = np.linspace(0.01, 0.99, count)
-        entries = norm.ppf(probabilities, loc=loc, scale=scale)
+        # Raw inverse-normal ufunc; norm.ppf adds rv_continuous validation overhead
+        entries = ndtri(probabilities) * scale + loc
         entries = np.clip(entries, min_p, max_p)
         self._add_bulk_trades(entries, profit, qty, loop)
 
     def _add_bulk_trades(self, entries: np.ndarray, profit_pct: float, qty: float, loop: bool):
-        for entry in entries:
-            entry_price = float(round(entry, 5))
-            markup = 1 + (profit_pct / 100.0)
-            exit_price = round(entry_price * markup, 5)
-            self.add_trade(entry_price, exit_price, qty, loop)
+        # Price math in one vectorized pass, written straight into the pool columns
+        entries = np.round(np.asarray(entries, dtype=np.float64), 5)
+        exits = np.round(entries * (1.0 + profit_pct / 100.0), 5)
+        self._bulk_add(entries, exits, qty, loop)
+        if len(entries):
+            ops_logger.info("Added %d trades | Entries: %s - %s | Profit: %s%%", len(entries), entries.min(), entries.max(), profit_pct)
+
+    def _bind_pool(self, pool: ExecutorPool):
+        """Replaces the pool and creates one executor view per row."""
+        self.pool = pool
+        self._executors = [PositionExecutor.view(self.client, pool, i) for i in range(pool.size)]
+        self._seen_version = -1
+
+    def _bulk_add(self, entries: np.ndarray, exits: np.ndarray, qty: float, loop_trade: bool):
+        """Writes all rows into the pool in one pass, then binds a view per row."""
+        rows = self.pool.extend(entries, exits, qty, self.maker_offset_buy, self.maker_offset_sell, loop_trade)
+        self._executors.extend(PositionExecutor.view(self.client, self.pool, i) for i in rows)
+
+    # --- WebSocket Ingestion ---
+
+    def start_streams(self):
+        """
+        Subscribes to the private order stream and the public ticker stream.
+        Once running, process_tick reads the in-memory caches instead of polling REST.
+        """
+        self.client.start_order_stream(self._on_order_event)
+        self.client.start_ticker_stream(self._on_price_event)
+
+        # Seed the caches once with orders that existed before the subscription.
+        # Stream events that already arrived win over the (older) REST snapshot.
+        history = self.client.get_order_history(limit=200)
+        open_orders = self.client.get_open_orders()
+        price = self.client.get_current_price()
+        with self._stream_lock:
+            if self._current_price is None:
+                self._current_price = price
+            seed = [o for o in history + open_orders if o['order_id'] not in self._order_history_map]
+        self._on_order_event(seed)
+
+        self._streaming = True
+        ops_logger.info("WebSocket streams started. process_tick now reads cached order state.")
+
+    def _on_price_event(self, price: float):
+        self._current_price = price
+        self._update_event.set()
+
+    def _on_order_event(self, orders: List[Dict[str, Any]]):
+        """Applies order updates to the caches (runs on the WebSocket thread)."""
+        with self._stream_lock:
+            open_ids = set(self._open_order_ids)
+            # Interned IDs let membership tests hit the pointer-equality fast path
+            records = [OrderRecord.from_order(order) for order in orders]
+            self._remember_orders(records)
+            for record in records:
+                if record.status in self.OPEN_ORDER_STATUSES:
+                    open_ids.add(record.order_id)
+                else:
+                    open_ids.discard(record.order_id)
+            # Publish a new immutable snapshot; a running tick keeps the one it read
+            self._open_order_ids = frozenset(open_ids)
+            self._order_version += 1
+        self._update_event.set()
+
+    def _remember_orders(self, records: List[OrderRecord]):
+        """Upserts records into the bounded LRU history cache (caller holds _stream_lock)."""
+        cache = self._order_history_map
+        for record in records:
+            cache[record.order_id] = record
+            cache.move_to_end(record.order_id)
+        while len(cache) > self.HISTORY_CACHE_SIZE:
+            cache.popitem(last=False)
+
+    def wait_for_update(self, timeout: Optional[float] = None) -> bool:
+        """
+        Blocks until a stream event (price or order update) arrives, or `timeout` passes.
+        Lets a live grid loop tick on new data instead of sleeping blindly:
+            while True:
+                manager.wait_for_update(timeout=5.0)
+                manager.process_tick()
+        Returns True if an event arrived. Without streams it just waits out the timeout.
+        """
+        arrived = self._update_event.wait(timeout)
+        # Cleared before the caller ticks: a later event wakes the next wait
+        self._update_event.clear()
+        return arrived
 
     def process_tick(self):
         """Main heartbeat logic called every few seconds (For Grid Bot)."""
@@ -262,65 +724,327 @@ class TradeManager:
             return
 
         try:
-            current_price = self.client.get_current_price()
-            open_orders_raw = self.client.get_open_orders()
-            history_raw = self.client.get_order_history(limit=200)
-            
-            active_ids: Set[str] = {o['order_id'] for o in open_orders_raw}
-            h_map: Dict[str, Any] = {o['order_id']: o for o in history_raw}
-            
-            active_executors = []
-            for executor in self.executors:
-                status = executor.execute_cycle(current_price, active_ids, h_map)
-                if status != ExecutorState.COMPLETED:
-                    active_executors.append(executor)
-            
-            self.executors = active_executors
+            version = None
+            if self._streaming:
+                # Read before the caches: an event landing mid-tick forces the next tick to run
+                version = self._order_version
+                # Shared as-is with every executor: no per-tick set/dict rebuild
+                current_price = self._current_price
+                active_ids: FrozenSet[str] = self._open_order_ids
+                h_map: Mapping[str, OrderRecord] = self._order_history_view
+                if current_price is None:
+                    return
+            else:
+                current_price = self.client.get_current_price()
+                open_orders_raw = self.client.get_open_orders()
+                history_raw = self.client.get_order_history(limit=200)
+
+                intern = sys.intern
+                active_ids = frozenset(intern(o['order_id']) for o in open_orders_raw)
+                # Merged into the cache (history is newest-first) rather than rebuilt, so
+                # orders that scroll out of the last 200 can still be seen as Filled
+                records = [OrderRecord.from_order(o) for o in reversed(history_raw)]
+                with self._stream_lock:
+                    self._remember_orders(records)
+                h_map = self._order_history_view
         except Exception as e:
             ops_logger.error(f"Tick Failure: {e}")
+            return
+
+        order_queue = [] if self.batch_orders else None
+        # Partition rows by state up front: every executor runs exactly one step per
+        # tick, and each loop below only visits executors that step applies to.
+        # One compiled pass also drops rows backing off after a rejected placement
+        # and computes the limit price of every placement.
+        pool = self.pool
+        n = pool.size
+        (pending_entry, entry_limits, placed_entry,
+         filled_wait, exit_limits, placed_exit) = _grid_tick_plan(
+            pool.state[:n], pool.retry_after[:n], pool.target_entry[:n], pool.target_exit[:n],
+            pool.maker_offset_buy[:n], pool.maker_offset_sell[:n], float(current_price), time.monotonic(),
+            _PENDING_ENTRY, _PLACED_ENTRY, _FILLED_WAIT, _PLACED_EXIT
+        )
+
+        # Streaming only (REST has no change signal): nothing to place and no order
+        # event since the last tick means every step below would be a no-op
+        if self._streaming and version == self._seen_version and not len(pending_entry) and not len(filled_wait):
+            return
+
+        entry_limits = entry_limits.tolist()
+        exit_limits = exit_limits.tolist()
+        placed_entry = placed_entry.tolist()
+        placed_exit = placed_exit.tolist()
+
+        # Each executor fails on its own: one bad step must not void the rest of the tick
+        failures = 0
+        executors = self._executors
+        for i, limit_price in zip(pending_entry.tolist(), entry_limits):
+            executor = executors[i]
+            try:
+                executor._submit(executor.order_request("Buy", limit_price), order_queue)
+            except Exception as e:
+                failures += 1
+                ops_logger.exception("Executor failed: %s", e)
+        for i in placed_entry:
+            try:
+                executors[i]._track_entry(active_ids, h_map)
+            except Exception as e:
+                failures += 1
+                ops_logger.exception("Executor failed: %s", e)
+        for i, limit_price in zip(filled_wait.tolist(), exit_limits):
+            executor = executors[i]
+            try:
+                executor._submit(executor.order_request("Sell", limit_price), order_queue)
+            except Exception as e:
+                failures += 1
+                ops_logger.exception("Executor failed: %s", e)
+        for i in placed_exit:
+            try:
+                executors[i]._track_exit(active_ids, h_map)
+            except Exception as e:
+                failures += 1
+                ops_logger.exception("Executor failed: %s", e)
+        # A failed step gets another look on the next tick even without a new order event
+        if not failures:
+            self._seen_version = version
+
+        self._drop_completed()
+
+        if order_queue:
+            try:
+                self._flush_orders(order_queue)
+            except Exception as e:
+                ops_logger.error(f"Tick Failure: {e}")
+
+    def _drop_completed(self):
+        """Compacts COMPLETED rows out of the pool and re-indexes the surviving views."""
+        keep = self.pool.state[:self.pool.size] != _COMPLETED
+        if keep.all():
+            return
+        self.pool.compact(keep)
+        self._executors = [executor for executor, k in zip(self._executors, keep.tolist()) if k]
+        for i, executor in enumerate(self._executors):
+            executor.idx = i
+
+    def _flush_orders(self, order_queue: List):
+        """Submits the tick's queued orders in batches and scatters the results back."""
+        results = self.client.place_batch_limit_orders([request for _, request in order_queue])
+        for (executor, request), result in zip(order_queue, results):
+            executor.on_order_result(request, result)
 
     def get_ui_data(self) -> List[Dict[str, Any]]:
         """Provides a JSON-serializable summary for Web Dashboards."""
-        return [executor.to_dict() for executor in self.executors]
+        return self.pool.to_records()
 
     # --- Updated Persistence Logic (Compatible with run_live.py) ---
 
     def save_state(self, data: Dict[str, Any]):
-        """Helper alias required by run_live.py to save dictionary data."""
-        self.save_to_disk(data=data)
+        """
+        Helper required by run_live.py to save dictionary data.
+        Non-blocking: marks the state dirty and a background thread writes the
+        latest one every SAVE_INTERVAL seconds (and once more at exit).
+        """
+        with self._save_lock:
+            self._pending_state = data
+            self._dirty = True
+            if self._saver is None:
+                self._saver = threading.Thread(target=self._save_loop, name="state-saver", daemon=True)
+                self._saver.start()
+                atexit.register(self.flush_state)
+
+    def _save_loop(self):
+        while True:
+            time.sleep(self.SAVE_INTERVAL)
+            self.flush_state()
+
+    def flush_state(self):
+        """Writes the latest save_state() data now if it has not been written yet."""
+        with self._write_lock:
+            with self._save_lock:
+                if not self._dirty:
+                    return
+                data, self._dirty = self._pending_state, False
+            self.save_to_disk(data=data)
 
-    def save_to_disk(self, filename: str = None, data: Any = None):
+    def save_to_disk(self, filename: str = None, data: Any = None, fast: bool = False):
         """
         Saves session to JSON. 
         Supports both:
         1. Single Strategy Data (Passed via 'data')
         2. Grid Executor List (If data is None)
+        fast=True pickles the executor pool (protocol 5) instead of writing JSON; only
+        grid state qualifies, and the file is meant for this bot's own load_from_disk.
         """
         target_file = filename if filename else self.state_file
+        self.wait_for_writes()
         
         try:
-            # If explicit data provided (run_live.py), save it.
-            # Else, save the list of executors (Grid Bot).
-            content = data if data is not None else self.get_ui_data()
-            
-            with open(target_file, 'w') as f:
-                json.dump(content, f, indent=4)
+            if fast and data is None:
+                payload = pickle.dumps(self.pool, protocol=5)
+            else:
+                # If explicit data provided (run_live.py), save it.
+                # Else, save the list of executors (Grid Bot).
+                payload = self._encode_state(data if data is not None else self.get_ui_data())
+            self._write_file(target_file, payload)
+            # The full state supersedes any save_delta() log; replaying it would roll back
+            # newer state whenever this snapshot serializes to the log's base bytes
+            if os.path.exists(target_file + ".jsonl"):
+                os.remove(target_file + ".jsonl")
+            self._delta_base = None
+            self._delta_count = 0
         except Exception as e:
             ops_logger.error(f"Save failure: {e}")
 
+    @staticmethod
+    def _encode_state(content: Any) -> bytes:
+        if orjson is not None:
+            return orjson.dumps(content, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+        return json.dumps(content, indent=4).encode()
+
+    @staticmethod
+    def _write_file(target_file: str, payload: bytes):
+        # Write-then-rename: a crash mid-save never leaves a truncated state file
+        tmp_file = target_file + ".tmp"
+        with open(tmp_file, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_file, target_file)
+
+    def save_delta(self, filename: str = None):
+        """
+        Write-ahead alternative to save_to_disk() for frequent grid saves. Appends only the
+        executors changed since the previous call to `<state file>.jsonl` as one line:
+        {"size": rows, "rows": {index: executor.to_dict()}}. A full snapshot replaces the
+        log on the first call, every DELTA_SNAPSHOT_EVERY deltas, and whenever completed
+        trades were dropped (rows renumbered). load_from_disk() replays the log.
+        The diff and records are taken here; encoding and the file write run on a
+        background thread, and the next call only waits if that write is still running.
+        """
+        target_file = filename if filename else self.state_file
+        self.wait_for_writes()
+        pool = self.pool
+        base = self._delta_base
+
+        if (base is None or base['pool'] is not pool or base['layout'] != pool.layout
+                or base['size'] > pool.size or self._delta_count >= self.DELTA_SNAPSHOT_EVERY):
+            self._delta_base = self._capture_delta_base()
+            self._delta_count = 0
+            self._submit_write(self._write_delta_snapshot, target_file, self.get_ui_data())
+            return
+
+        n, old = pool.size, base['size']
+        changed = np.zeros(n, dtype=np.bool_)
+        changed[old:] = True
+        for name in base['columns']:
+            changed[:old] |= getattr(pool, name)[:old] != base['columns'][name]
+        ids = base['active_order_id']
+        changed[:old] |= [a is not b and a != b for a, b in zip(pool.active_order_id, ids)]
+
+        rows = np.flatnonzero(changed)
+        if rows.size == 0:
+            return
+        entry = {"size": n, "rows": dict(zip(rows.tolist(), pool.to_records(rows)))}
+        self._delta_count += 1
+        self._delta_base = self._capture_delta_base()
+        self._submit_write(self._append_delta, target_file, entry,
+                           self._delta_count % self.DELTA_FSYNC_EVERY == 0)
+
+    def wait_for_writes(self):
+        """Blocks until the background save_delta() write (if any) has finished."""
+        if self._io_pending is not None:
+            self._io_pending.result()
+            self._io_pending = None
+
+    def _submit_write(self, func, *args):
+        if self._io is None:
+            self._io = ThreadPoolExecutor(max_workers=1, thread_name_prefix="state-io")
+        self._io_pending = self._io.submit(func, *args)
+
+    def _append_delta(self, target_file: str, entry: Dict[str, Any], fsync: bool):
+        """Background half of save_delta(): one JSONL line onto the log."""
+        try:
+            line = orjson.dumps(entry, option=orjson.OPT_NON_STR_KEYS) if orjson is not None else json.dumps(entry).encode()
+            with open(target_file + ".jsonl", 'ab') as f:
+                f.write(line + b"\n")
+                if fsync:
+                    f.flush()
+                    os.fsync(f.fileno())
+        except Exception as e:
+            # The change is not on disk: force a full snapshot on the next save_delta()
+            self._delta_base = None
+            ops_logger.error(f"Delta save failure: {e}")
+
+    def _capture_delta_base(self) -> Dict[str, Any]:
+        """Copies the persisted pool columns, the reference the next save_delta() diffs against."""
+        pool = self.pool
+        n = pool.size
+        return {
+            'pool': pool, 'layout': pool.layout, 'size': n,
+            'columns': {name: getattr(pool, name)[:n].copy()
+                        for name in ExecutorPool.RECORD_FIELDS if name != 'active_order_id'},
+            'active_order_id': list(pool.active_order_id),
+        }
+
+    def _write_delta_snapshot(self, target_file: str, records: List[Dict[str, Any]]):
+        """Full state file from `records`, then a fresh log whose header names that snapshot by CRC."""
+        try:
+            payload = self._encode_state(records)
+            self._write_file(target_file, payload)
+            header = json.dumps({"base": zlib.crc32(payload)}).encode()
+            # Atomic reset: a crash leaves the old log, whose header no longer matches
+            tmp_file = target_file + ".jsonl.tmp"
+            with open(tmp_file, 'wb') as f:
+                f.write(header + b"\n")
+            os.replace(tmp_file, target_file + ".jsonl")
+        except Exception as e:
+            self._delta_base = None
+            ops_logger.error(f"Delta snapshot failure: {e}")
+
+    def _replay_deltas(self, target_file: str, raw: bytes):
+        """Applies the save_delta() log to the freshly loaded pool if it belongs to this snapshot."""
+        log_file = target_file + ".jsonl"
+        if not os.path.exists(log_file):
+            return
+        with open(log_file, 'rb') as f:
+            lines = f.read().splitlines()
+        if not lines or json.loads(lines[0]).get("base") != zlib.crc32(raw):
+            return  # Log from an older snapshot: the snapshot already holds its changes
+
+        applied = 0
+        for line in lines[1:]:
+            try:
+                entry = orjson.loads(line) if orjson is not None else json.loads(line)
+            except ValueError:
+                break  # Torn final line from a crash mid-append
+            self.pool.apply_delta(entry["size"], {int(i): rec for i, rec in entry["rows"].items()})
+            applied += 1
+        if applied:
+            self._bind_pool(self.pool)
+            ops_logger.info(f"Replayed {applied} state deltas.")
+
     def load_from_disk(self, filename: str = None):
-        """Restores session from JSON."""
+        """Restores session from JSON (or from a pickled pool written with fast=True)."""
         target_file = filename if filename else self.state_file
+        self.wait_for_writes()
         
         if not os.path.exists(target_file):
             return None
         try:
-            with open(target_file, 'r') as f:
-                data = json.load(f)
+            with open(target_file, 'rb') as f:
+                raw = f.read()
+
+            # Pickle streams start with the PROTO opcode; JSON never does
+            if raw[:1] == pickle.PROTO:
+                self._bind_pool(pickle.loads(raw))
+                self._replay_deltas(target_file, raw)
+                ops_logger.info(f"Restored {len(self.executors)} executors.")
+                return self.executors
+
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
             
             # Case 1: Data is a List -> It's a Grid Bot State
             if isinstance(data, list):
-                self.executors = [PositionExecutor.from_dict(entry, self.client) for entry in data]
+                self._bind_pool(ExecutorPool.from_records(data))
+                self._replay_deltas(target_file, raw)
                 ops_logger.info(f"Restored {len(self.executors)} executors.")
                 return self.executors
             
@@ -340,12 +1064,14 @@ class TradeManager:
         return os.path.exists(self.state_file)
 
     def clear_state(self):
-        """Deletes the state file."""
-        if os.path.exists(self.state_file):
-            try:
-                os.remove(self.state_file)
-            except Exception:
-                pass
+        """Deletes the state file (and its save_delta log)."""
+        self.wait_for_writes()
+        for path in (self.state_file, self.state_file + ".jsonl"):
+            if os.path.exists(path):
+                try:
+                    os.remove(path)
+                except Exception:
+                    pass
 
     def reconcile_after_crash(self):
         """
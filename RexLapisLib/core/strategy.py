@@ -1,7 +1,23 @@
+import numpy as np
 import pandas as pd
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, NamedTuple
 from .context import IContext
 
+
+class FastSignals(NamedTuple):
+    """
+    Per-row decisions for the BacktestEngine array fast path.
+    Only for long-only strategies that trade at market with their whole position:
+    enter when flat, otherwise exit when long (evaluated as if/elif).
+    """
+    enter: np.ndarray            # bool per row: buy when flat
+    exit: np.ndarray             # bool per row: close the long
+    risk: float                  # Fraction of balance used as margin per entry
+    leverage: float              # Sizing: qty = (balance * risk) * leverage / close
+    qty_decimals: int = -1       # Floor qty to n decimals before ordering; -1 = none
+    min_qty: float = 0.0         # The order is skipped unless qty > min_qty
+
+
 class Strategy:
     """
     Base Strategy Class. 
@@ -24,10 +40,29 @@ class Strategy:
         """
         pass
 
+    def prepare(self, df: pd.DataFrame):
+        """
+        Lifecycle Method: Called by the BacktestEngine with the full indicator
+        DataFrame before the candle loop. Use it to precompute vectorized signals;
+        on_candle_tick then receives df.iloc[:i+1], so row i is len(slice) - 1.
+        Not called in live trading.
+        """
+        pass
+
+    def fast_signals(self, df: pd.DataFrame) -> Optional[FastSignals]:
+        """
+        Optional backtest fast path. Return FastSignals built from the full
+        indicator DataFrame and the BacktestEngine replays them in a compiled
+        loop instead of calling on_candle_tick per candle.
+        Return None (default) to keep the candle-by-candle loop.
+        """
+        return None
+
     def on_candle_tick(self, df: pd.DataFrame):
-        current_price = df.iloc[-1]['close']
+        current_price = df['close'].iat[-1]
+        pos = self.position  # One lookup per tick (an API call in live trading)
         
-        if not self.position:
+        if not pos:
             target_price = current_price * 0.999 
             
             self.buy(
@@ -38,7 +73,7 @@ class Strategy:
             
         else:
             self.sell(
-                qty=self.position['qty'], 
+                qty=pos['qty'], 
                 reduce_only=True 
             )
 
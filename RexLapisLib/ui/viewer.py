@@ -1,5 +1,6 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 import pickle
 import json
 import plotly.graph_objects as go
@@ -72,7 +73,8 @@ def resample_data(df, interval):
     rule_map = {"1min": "1min", "5min": "5min", "15min": "15min", "1H": "1h", "4H": "4h", "1D": "1D"}
     rule = rule_map.get(interval, "1min")
     
-    df_temp = df.set_index('timestamp').copy()
+    # set_index already returns a new frame, no extra copy needed
+    df_temp = df.set_index('timestamp')
     
     agg_dict = {'open': 'first', 'high': 'max', 'low': 'min', 'close': 'last'}
     if 'volume' in df_temp.columns: agg_dict['volume'] = 'sum'
@@ -145,11 +147,20 @@ selected_oscillators = st.sidebar.multiselect("Indicators", oscillator_options,
 # ---------------------------------------------------------
 # 4. CHART DATA PREP
 # ---------------------------------------------------------
-df_display = resample_data(df_full, selected_tf)
-
-# Optimization: Slice
+# Only carry the columns the chart actually draws
+indicator_cols = {'RSI': ['rsi'], 'MACD': ['macd', 'macd_signal', 'macd_hist'], 'Score': ['score']}
+plot_cols = [c for c in ['timestamp', 'open', 'high', 'low', 'close', 'volume'] if c in df_full.columns]
+plot_cols += selected_overlays
+plot_cols += [c for osc in selected_oscillators for c in indicator_cols.get(osc, []) if c in df_full.columns]
+plot_cols = list(dict.fromkeys(plot_cols))
+
+# Without resampling, only the visible window is needed
+df_source = df_full.iloc[-max_candles:] if selected_tf == "Original" else df_full
+df_display = resample_data(df_source[plot_cols], selected_tf)
+
+# Optimization: Slice (read-only positional view, the chart never mutates it)
 if len(df_display) > max_candles:
-    df_display = df_display.tail(max_candles).reset_index(drop=True)
+    df_display = df_display.iloc[-max_candles:]
 
 df_trades = pd.DataFrame(results['trades_log'])
 
@@ -246,7 +257,7 @@ if show_trades and not df_trades.empty:
 for osc in selected_oscillators:
     curr += 1
     if osc == 'Volume':
-        cols = ['#00E676' if c >= o else '#FF1744' for c, o in zip(df_display['close'], df_display['open'])]
+        cols = np.where(df_display['close'].values >= df_display['open'].values, '#00E676', '#FF1744').tolist()
         fig.add_trace(go.Bar(x=df_display['timestamp'], y=df_display['volume'], marker_color=cols, name="Vol"), row=curr, col=1)
     elif osc == 'RSI':
         fig.add_trace(go.Scatter(x=df_display['timestamp'], y=df_display['rsi'], name="RSI", line=dict(color='#AB47BC')), row=curr, col=1)
@@ -254,14 +265,15 @@ for osc in selected_oscillators:
         fig.add_hline(y=30, line_dash="dot", line_color="green", row=curr, col=1)
     elif osc == 'MACD':
         if 'macd_hist' in df_display.columns:
-            cols = ['#00E676' if v >= 0 else '#FF1744' for v in df_display['macd_hist']]
+            cols = np.where(df_display['macd_hist'].values >= 0, '#00E676', '#FF1744').tolist()
             fig.add_trace(go.Bar(x=df_display['timestamp'], y=df_display['macd_hist'], marker_color=cols, name="Hist"), row=curr, col=1)
         if 'macd' in df_display.columns:
             fig.add_trace(go.Scatter(x=df_display['timestamp'], y=df_display['macd'], name="MACD", line=dict(color='#2979FF')), row=curr, col=1)
         if 'macd_signal' in df_display.columns:
             fig.add_trace(go.Scatter(x=df_display['timestamp'], y=df_display['macd_signal'], name="Sig", line=dict(color='#FFA726')), row=curr, col=1)
     elif osc == 'Score':
-        cols = ['#00E676' if v >= 4 else '#FF1744' if v <= -4 else 'gray' for v in df_display['score']]
+        score = df_display['score'].values
+        cols = np.select([score >= 4, score <= -4], ['#00E676', '#FF1744'], 'gray').tolist()
         fig.add_trace(go.Bar(x=df_display['timestamp'], y=df_display['score'], marker_color=cols, name="Score"), row=curr, col=1)
 
 # --- VIEWPORT & LAYOUT ---
@@ -1,6 +1,9 @@
 import sys
 import os
-import time
+import asyncio
+import argparse
+import importlib
+import numpy as np
 import pandas as pd
 from dotenv import load_dotenv
 
@@ -9,18 +12,71 @@ sys.path.append(os.getcwd())
 
 from RexLapisLib import Client, LiveContext, TechnicalEngine
 from RexLapisLib.core.manager import TradeManager  
-from strategies.pro_features_test_strategy import ProFeaturesTestStrategy
 
 # Load API Keys from .env file
 load_dotenv()
 
-def main():
+PRICE_FIELDS = ('open', 'high', 'low', 'close', 'volume')
+DEFAULT_STRATEGY = "strategies.pro_features_test_strategy:ProFeaturesTestStrategy"
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="RexLapis live trading engine")
+    parser.add_argument("--strategy", default=DEFAULT_STRATEGY,
+                        help="Strategy class as 'module:Class' (default: %(default)s)")
+    parser.add_argument("--symbol", default="XAUTUSDT")
+    parser.add_argument("--timeframe", default="1", help="Kline interval: 1, 5, 15, 60, D")
+    parser.add_argument("--rest", action="store_true",
+                        help="Poll REST every 10s instead of streaming closed candles")
+    return parser.parse_args(argv)
+
+def load_strategy(spec: str):
+    """Imports and instantiates a 'module:Class' strategy spec."""
+    module_name, _, class_name = spec.partition(":")
+    return getattr(importlib.import_module(module_name), class_name)()
+
+def candles_to_frame(candles) -> pd.DataFrame:
+    """Candle dicts (oldest -> newest) to a DataFrame; start_time (ms) becomes 'timestamp'."""
+    n = len(candles)
+    # Typed columns in one pass each: skips pandas' list-of-dicts inference
+    start = np.fromiter((c['start_time'] for c in candles), dtype=np.int64, count=n)
+    columns = {'start_time': start}
+    for field in PRICE_FIELDS:
+        columns[field] = np.fromiter((c[field] for c in candles), dtype=np.float64, count=n)
+    # Integer ms straight to datetime64, no float round-trip or re-sort
+    columns['timestamp'] = start.astype('datetime64[ms]')
+    # Any extra keys (e.g. indicator values from update_last)
+    for key in ([k for k in candles[0] if k not in columns] if n else ()):
+        columns[key] = np.array([c[key] for c in candles])
+    return pd.DataFrame(columns)
+
+def on_new_candle(df: pd.DataFrame, strategy, context: LiveContext, manager: TradeManager):
+    """Per-candle hot path: run the strategy, then queue the state for saving."""
+    current_candle_timestamp = df['timestamp'].iat[-1]
+    print(f"\n[NEW CANDLE] {current_candle_timestamp} | Price: {df['close'].iat[-1]}")
+    
+    # Run strategy tick
+    strategy.on_candle_tick(df)
+    
+    # --- AUTO-SAVE LOGIC ---
+    # Save the bot's mind to disk (within a few seconds) to survive power cuts
+    state_to_save = {
+        "last_processed_time": str(current_candle_timestamp),
+        "position": strategy.position,
+        "balance": context.get_balance()
+    }
+    # Non-blocking: the manager's background writer coalesces saves
+    manager.save_state(state_to_save)
+
+async def main(args: argparse.Namespace):
     print("--- Starting RexLapis LIVE TRADING Engine (Fault-Tolerant Version) ---")
     
     # 1. Configuration
-    SYMBOL = "XAUTUSDT"
-    TIMEFRAME = "1"  # 1-minute interval
+    SYMBOL = args.symbol
+    TIMEFRAME = args.timeframe
     STATE_FILE = "bot_memory.json" # Memory file to survive power cuts
+    USE_WEBSOCKET = not args.rest  # Stream closed candles; --rest polls REST every 10s
+    STREAM_TIMEOUT = 150   # Seconds without a closed candle before resyncing over REST
+    MAX_CANDLES = 500      # Rolling candle buffer fed to the indicators
     
     API_KEY = os.getenv("API_KEY")
     API_SECRET = os.getenv("API_SECRET")
@@ -40,7 +96,7 @@ def main():
     )
 
     context = LiveContext(client)
-    strategy = ProFeaturesTestStrategy()
+    strategy = load_strategy(args.strategy)
     strategy.setup(context)
     tech_engine = TechnicalEngine()
 
@@ -57,61 +113,93 @@ def main():
 
     print(f"Bot initialized for {SYMBOL}. Waiting for next candle...")
 
-    last_processed_timestamp = None 
+    last_processed_epoch = -1  # start_time (ms) of the last candle the strategy saw
+
+    # Closed candles arrive on the WebSocket thread and are handed to the event loop
+    df = None  # Rolling candle + indicator buffer, kept between ticks
+    window_key = None  # (first start_time, last start_time, rows) of the REST window behind df
+    loop = asyncio.get_running_loop()
+    bar_queue = asyncio.Queue()
+    if USE_WEBSOCKET:
+        context.subscribe_kline(TIMEFRAME, lambda bar: loop.call_soon_threadsafe(bar_queue.put_nowait, bar))
 
     # 3. Live Trading Loop (Network-Resilient)
     while True:
         try:
             # A. Fetch candles (Handled by @auto_resync inside Client)
-            # If internet is down, this call will freeze and retry automatically
-            candles_data = client.get_candles(interval=TIMEFRAME, limit=200)
-            
-            if not candles_data:
-                time.sleep(5)
-                continue
-
-            # Convert and process data
-            df = pd.DataFrame(candles_data)
-            df['timestamp'] = pd.to_datetime(df['start_time'].astype(float), unit='ms')
-            df.sort_values('timestamp', inplace=True)
-            df = tech_engine.apply_all_indicators(df)
-
-            # Get the current candle timestamp
-            current_candle_timestamp = df.iloc[-1]['timestamp']
+            # If internet is down, this call will retry automatically (in a worker thread)
+            if USE_WEBSOCKET:
+                try:
+                    bar = None if df is None else await asyncio.wait_for(bar_queue.get(), STREAM_TIMEOUT)
+                except asyncio.TimeoutError:
+                    bar = None
+                if bar is None:
+                    # Seed (or resync after a silent stream) over REST; the newest
+                    # REST candle is still forming, so only closed ones are kept.
+                    # Indicators are computed in full once; the engine keeps their running state.
+                    closed = (await asyncio.to_thread(client.get_candles, interval=TIMEFRAME, limit=200))[:-1]
+                    if not closed:
+                        df = None
+                        await asyncio.sleep(5)
+                        continue
+                    df = tech_engine.prime(candles_to_frame(closed))
+                elif bar['start_time'] <= df['start_time'].iat[-1]:
+                    continue  # Already have this bar (e.g. from a REST resync)
+                else:
+                    candle = {k: bar[k] for k in ('start_time', 'open', 'high', 'low', 'close', 'volume')}
+                    # Only the new candle's indicator values are computed
+                    candle.update(tech_engine.update_last(candle))
+                    # Append one row, dropping the oldest once the buffer is full
+                    df = pd.concat([df.iloc[-(MAX_CANDLES - 1):], candles_to_frame([candle])], ignore_index=True)
+            else:
+                candles_data = await asyncio.to_thread(client.get_candles, interval=TIMEFRAME, limit=200)
+                
+                if not candles_data:
+                    await asyncio.sleep(5)
+                    continue
+
+                # Same window (candle still forming): reuse the previous DataFrame entirely
+                key = (candles_data[0]['start_time'], candles_data[-1]['start_time'], len(candles_data))
+                if key == window_key:
+                    print(".", end="", flush=True)
+                    await asyncio.sleep(10)
+                    continue
+
+                if len(candles_data) > 1 and df is not None and candles_data[-2]['start_time'] == df['start_time'].iat[-1]:
+                    # One new candle: settle the previous (now closed) row, then add the new one
+                    closed, forming = dict(candles_data[-2]), dict(candles_data[-1])
+                    closed.update(tech_engine.update_last(closed, amend=True))
+                    forming.update(tech_engine.update_last(forming))
+                    df = pd.concat([df.iloc[-(len(candles_data) - 1):-1], candles_to_frame([closed, forming])], ignore_index=True)
+                else:
+                    # First poll or a gap: full indicator pass, which also seeds the streaming state
+                    df = tech_engine.prime(candles_to_frame(candles_data))
+                window_key = key
+
+            # Current candle as raw epoch ms: a plain int compare, no Timestamp equality
+            current_epoch = int(df['start_time'].iat[-1])
 
             # B. Execute Strategy Logic on New Candle
-            if current_candle_timestamp != last_processed_timestamp:
-                print(f"\n[NEW CANDLE] {current_candle_timestamp} | Price: {df.iloc[-1]['close']}")
-                
-                # Run strategy tick
-                strategy.on_candle_tick(df)
-                
-                # --- AUTO-SAVE LOGIC ---
-                # Immediately save the bot's mind to disk to survive power cuts
-                state_to_save = {
-                    "last_processed_time": str(current_candle_timestamp),
-                    "position": strategy.position,
-                    "balance": context.get_balance()
-                }
-                manager.save_state(state_to_save)
-                
-                last_processed_timestamp = current_candle_timestamp
+            if current_epoch != last_processed_epoch:
+                on_new_candle(df, strategy, context, manager)
+                last_processed_epoch = current_epoch
 
             else:
                 # Still in the same minute, show heartbeat
                 print(".", end="", flush=True) 
             
-            # Polling delay
-            time.sleep(10) 
+            # Polling delay (the stream blocks on the next candle instead)
+            if not USE_WEBSOCKET:
+                await asyncio.sleep(10) 
 
-        except KeyboardInterrupt:
-            print("\n--- Stopping Live Engine Safely ---")
-            break
         except Exception as e:
             # Final safety net for unexpected software bugs
             print(f"\n🚨 [CRITICAL ERROR]: {e}")
             print("Attempting to stay alive. Cooling down for 30s...")
-            time.sleep(30)
+            await asyncio.sleep(30)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    try:
+        asyncio.run(main(parse_args()))
+    except KeyboardInterrupt:
+        print("\n--- Stopping Live Engine Safely ---")
\ No newline at end of file
@@ -1,5 +1,6 @@
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 
 # Add project root
@@ -21,6 +22,24 @@ VISUALIZE = True         # Show Dashboard?
 AUTO_UPDATE_DATA = True  # <--- NEW: Fetch fresh data before running?
 SYMBOL = "XAUTUSDT"
 
+def sync_data(processor, api_key, api_secret):
+    """Fetches candles missing from the local CSV; failures fall back to the local file."""
+    try:
+        # Initialize Client (Using Mainnet to get real history)
+        client = Client(
+            symbol=SYMBOL, 
+            api_key=api_key, 
+            api_secret=api_secret, 
+            api_endpoint="mainnet" 
+        )
+        
+        # Use the processor's sync logic
+        processor.sync_gap(client)
+        print("✅ Data is up-to-date.")
+        
+    except Exception as e:
+        print(f"⚠️ Warning: Could not update data. Using local file. Error: {e}")
+
 def main():
     print(f"--- Starting RexLapis Simulation: {SYMBOL} ---")
 
@@ -28,50 +47,43 @@ def main():
     processor = DataProcessor(symbol=SYMBOL, storage_dir="./data")
 
     # 2. AUTO-UPDATE LOGIC (Fetching fresh data)
+    # The download runs in a worker thread while the strategy and engine are set up
+    pool = ThreadPoolExecutor(max_workers=1)
+    sync_job = None
     if AUTO_UPDATE_DATA:
         api_key = os.getenv("API_KEY")
         api_secret = os.getenv("API_SECRET")
         
         if api_key and api_secret:
             print("📡 Connecting to Bybit to check for new data...")
-            try:
-                # Initialize Client (Using Mainnet to get real history)
-                client = Client(
-                    symbol=SYMBOL, 
-                    api_key=api_key, 
-                    api_secret=api_secret, 
-                    api_endpoint="mainnet" 
-                )
-                
-                # Use the processor's sync logic
-                # We assume processor has a method to sync. If not, we call it here.
-                processor.sync_gap(client)
-                print("✅ Data is up-to-date.")
-                
-            except Exception as e:
-                print(f"⚠️ Warning: Could not update data. Using local file. Error: {e}")
+            sync_job = pool.submit(sync_data, processor, api_key, api_secret)
         else:
             print("⚠️ Warning: API Keys not found in .env. Skipping auto-update.")
 
-    # 3. Load Data (Now it's fresh)
+    # 3. Prepare Strategy (overlaps the data sync)
+    my_strategy = ProFeaturesTestStrategy()
+    engine = BacktestEngine(strategy=my_strategy, initial_balance=10000)
+
+    if sync_job is not None:
+        sync_job.result()
+    pool.shutdown()
+
+    # 4. Load Data (Now it's fresh)
     df = processor.load_local_data()
 
     if df.empty:
         print("❌ Error: No data found. Please place a CSV or enable AUTO_UPDATE_DATA with valid API keys.")
         return
 
-    print(f"Loaded {len(df)} candles. Last candle: {df.iloc[-1]['timestamp']}")
+    print(f"Loaded {len(df)} candles. Last candle: {df['timestamp'].iat[-1]}")
 
-    # 4. Run Strategy
-    my_strategy = ProFeaturesTestStrategy()
-    engine = BacktestEngine(strategy=my_strategy, initial_balance=10000)
-    
+    # 5. Run Strategy
     print("🚀 Running simulation...")
     results = engine.run(df)
     
     results['strategy_name'] = my_strategy.__class__.__name__
 
-    # 5. Output
+    # 6. Output
     if VISUALIZE:
         show_dashboard(results)
     else:
@@ -1,5 +1,6 @@
+import numpy as np
 import pandas as pd
-from RexLapisLib import Strategy
+from RexLapisLib import Strategy, FastSignals
 
 class SentimentConfluenceStrategy(Strategy):
     """
@@ -14,6 +15,7 @@ class SentimentConfluenceStrategy(Strategy):
         self.sell_threshold = self.parameters.get('sell_threshold', -4) # Strong Sell Signal
         self.target_leverage = self.parameters.get('leverage', 5)
         self.risk_per_trade = self.parameters.get('risk', 0.5)         # Use 50% of balance
+        self._scores = None  # Backtest only: per-row scores from prepare()
         
         # 2. Setup Context Leverage
         if hasattr(self.ctx, 'set_leverage'):
@@ -23,6 +25,34 @@ class SentimentConfluenceStrategy(Strategy):
         print(f"Thresholds: Buy >= {self.buy_threshold} | Sell <= {self.sell_threshold}")
         print(f"Risk: {self.risk_per_trade*100}% at {self.target_leverage}x Leverage")
 
+    @staticmethod
+    def score_frame(df: pd.DataFrame) -> np.ndarray:
+        """Vectorized scoring engine: the same -7..+7 score for every row at once."""
+        i8 = np.int8
+        trend = df['trend_direction'].to_numpy(dtype=bool)
+        rsi = df['rsi'].to_numpy(dtype=np.float64)
+        # One mask + select per weight, all in int8 (no int64 temporaries or casts)
+        return (
+            np.where(trend, i8(3), i8(-3))
+            + np.where(rsi < 30, i8(2), np.where(rsi > 70, i8(-2), i8(0)))
+            + np.where(df['macd'].to_numpy() > df['macd_signal'].to_numpy(), i8(1), i8(-1))
+            + np.where(df['close'].to_numpy() > df['bb_mid'].to_numpy(), i8(1), i8(-1))
+        )
+
+    def prepare(self, df: pd.DataFrame):
+        """Scores the whole backtest once; on_candle_tick then just indexes it."""
+        self._scores = self.score_frame(df)
+
+    def fast_signals(self, df: pd.DataFrame) -> FastSignals:
+        """Backtest fast path: the same buy/exit rules as on_candle_tick, for every row."""
+        score = self.score_frame(df)
+        return FastSignals(
+            enter=score >= self.buy_threshold,
+            exit=score <= self.sell_threshold,
+            risk=self.risk_per_trade,
+            leverage=self.target_leverage
+        )
+
     def on_candle_tick(self, df: pd.DataFrame):
         """
         Main execution loop called for every candle by the BacktestEngine.
@@ -31,39 +61,43 @@ class SentimentConfluenceStrategy(Strategy):
         if len(df) < 2:
             return
 
-        # Get the latest row
-        row = df.iloc[-1]
-        
-        # --- ALGORITHMIC SCORING ENGINE ---
-        # Extracted from the Terminal 'analyze_market_sentiment' logic
-        score = 0
-        
-        # 1. SuperTrend Influence (Weight: 3)
-        if row['trend_direction']: 
-            score += 3
-        else: 
-            score -= 3
-        
-        # 2. RSI Mean Reversion (Weight: 2)
-        if row['rsi'] < 30: 
-            score += 2
-        elif row['rsi'] > 70: 
-            score -= 2
+        i = len(df) - 1
         
-        # 3. MACD Momentum (Weight: 1)
-        if row['macd'] > row['macd_signal']: 
-            score += 1
-        else: 
-            score -= 1
-        
-        # 4. Price vs Bollinger Mid (Weight: 1)
-        if row['close'] > row['bb_mid']: 
-            score += 1
-        else: 
-            score -= 1
+        if self._scores is not None and i < len(self._scores):
+            # Backtest: precomputed for every row in prepare()
+            score = int(self._scores[i])
+        else:
+            # --- ALGORITHMIC SCORING ENGINE (live: newest row only) ---
+            # Extracted from the Terminal 'analyze_market_sentiment' logic
+            row = {c: df[c].iat[-1] for c in ('trend_direction', 'rsi', 'macd', 'macd_signal', 'close', 'bb_mid')}
+            score = 0
+            
+            # 1. SuperTrend Influence (Weight: 3)
+            if row['trend_direction']: 
+                score += 3
+            else: 
+                score -= 3
+            
+            # 2. RSI Mean Reversion (Weight: 2)
+            if row['rsi'] < 30: 
+                score += 2
+            elif row['rsi'] > 70: 
+                score -= 2
+            
+            # 3. MACD Momentum (Weight: 1)
+            if row['macd'] > row['macd_signal']: 
+                score += 1
+            else: 
+                score -= 1
+            
+            # 4. Price vs Bollinger Mid (Weight: 1)
+            if row['close'] > row['bb_mid']: 
+                score += 1
+            else: 
+                score -= 1
 
         # --- EXECUTION LOGIC ---
-        current_price = row['close']
+        current_price = df['close'].iat[-1]
         pos = self.position #
 
         # A. BUY Logic (Enter Long)
@@ -1,5 +1,6 @@
+import math
 import pandas as pd
-from RexLapisLib.core.strategy import Strategy
+from RexLapisLib.core.strategy import Strategy, FastSignals
 
 class AdvancedRSIStrategy(Strategy):
     """
@@ -11,6 +12,7 @@ class AdvancedRSIStrategy(Strategy):
         self.rsi_period = 14
         self.target_leverage = 10     # 10x Leverage
         self.risk_per_trade = 0.50    # Use 50% of available wallet balance
+        self._qty_scale = 1000.0      # Qty step 0.001 (rounded down, never above the balance)
         
         # 2. Set Leverage in the Engine/Exchange
         # This works for both Backtest (Context) and Live (Bybit Client)
@@ -19,15 +21,29 @@ class AdvancedRSIStrategy(Strategy):
             
         print(f"Strategy Started. Lev: {self.target_leverage}x | Risk: {self.risk_per_trade*100}%")
 
+    def fast_signals(self, df: pd.DataFrame) -> FastSignals:
+        """Backtest fast path: the same RSI rules and sizing as on_candle_tick."""
+        rsi = df['rsi'].to_numpy(dtype=float)
+        return FastSignals(
+            enter=rsi < 30,
+            exit=rsi > 70,
+            risk=self.risk_per_trade,
+            leverage=self.target_leverage,
+            qty_decimals=3,
+            min_qty=0.001
+        )
+
     def on_candle_tick(self, df: pd.DataFrame):
-        current_candle = df.iloc[-1]
-        if 'rsi' not in current_candle: return
+        if 'rsi' not in df.columns: return
 
-        rsi = current_candle['rsi']
-        price = current_candle['close']
+        # Positional scalar access: no row Series is built per tick
+        rsi = df['rsi'].iat[-1]
+        price = df['close'].iat[-1]
+        # Read once per tick: in live trading each property access is an API call
+        pos = self.position
         
         # --- BUY LOGIC ---
-        if rsi < 30 and not self.position:
+        if rsi < 30 and not pos:
             # Portfolio Management Logic
             
             # 1. Get Wallet Balance
@@ -43,7 +59,7 @@ class AdvancedRSIStrategy(Strategy):
             
             # 4. Calculate Quantity
             qty = buying_power / price
-            qty = round(qty, 3)
+            qty = math.floor(qty * self._qty_scale) / self._qty_scale
 
             # Execution
             if qty > 0.001: # Min order check
@@ -51,6 +67,6 @@ class AdvancedRSIStrategy(Strategy):
                 self.buy(qty=qty)
 
         # --- SELL LOGIC ---
-        elif rsi > 70 and self.position:
-            qty = self.position['qty']
+        elif rsi > 70 and pos:
+            qty = pos['qty']
             self.sell(qty=qty)
\ No newline at end of file
@@ -23,22 +23,23 @@ class ProFeaturesTestStrategy(Strategy):
         print("✅ ProFeaturesTestStrategy Initialized.")
 
     def on_candle_tick(self, df: pd.DataFrame):
-        current_candle = df.iloc[-1]
-        current_price = current_candle['close']
+        current_price = df['close'].iat[-1]
+        # Read once per tick: in live trading each property access is an API call
+        pos = self.position
         
         # 1. Check if we have an open position
-        if self.position:
+        if pos:
             # Check if we already placed a Sell Limit order
             # This prevents the "Multiple Fills" bug seen in your logs
-            has_pending_sell = any(o['side'] == 'Sell' for o in self.ctx.pending_orders)
+            has_pending_sell = self.ctx.has_pending_order('Sell')
             
             if not has_pending_sell:
-                entry_price = self.position['entry_price']
+                entry_price = pos['entry_price']
                 limit_sell_price = entry_price * (1 + self.profit_target)
                 
-                print(f"[{current_candle['timestamp']}] 💰 Position Opened. Placing SINGLE Exit Order.")
+                print(f"[{df['timestamp'].iat[-1]}] 💰 Position Opened. Placing SINGLE Exit Order.")
                 self.sell(
-                    qty=self.position['qty'], 
+                    qty=pos['qty'], 
                     price=limit_sell_price, 
                     post_only=True, 
                     reduce_only=True
@@ -46,7 +47,7 @@ class ProFeaturesTestStrategy(Strategy):
             return # Exit tick processing if we are managing a position
 
         # 2. Entry Logic (Only if no position and no pending buy)
-        has_pending_buy = any(o['side'] == 'Buy' for o in self.ctx.pending_orders)
+        has_pending_buy = self.ctx.has_pending_order('Buy')
         if not has_pending_buy:
             limit_buy_price = current_price * (1 - self.entry_offset)
             buy_qty = (self.balance * self.risk_pct) / limit_buy_price
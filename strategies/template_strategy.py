@@ -31,8 +31,7 @@ class MyNewStrategy(Strategy):
         """
         # 1. Data Prep (Get last candle)
         # Note: RexLapis Engine handles indicators, or you can calc here
-        current = df.iloc[-1]
-        close_price = current['close']
+        close_price = df['close'].iat[-1]
         
         # Example: Calculate Indicator on the fly if not in DF
         # rsi = ta.rsi(df['close'], length=self.rsi_len).iloc[-1]
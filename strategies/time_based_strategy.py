@@ -1,3 +1,4 @@
+import math
 import pandas as pd
 from RexLapisLib import Strategy
 
@@ -21,6 +22,10 @@ class TimeBasedStrategy(Strategy):
             self.is_spot = False 
             mode_name = "BACKTEST"
 
+        # Qty step, rounded down so an order never exceeds the balance:
+        # 0.0001 USDT on spot, 0.001 XAUT on futures
+        self._qty_scale = 10000.0 if self.is_spot else 1000.0
+
         if self.is_spot:
             self.target_leverage = 1  
             print(f"Strategy Configured for {mode_name} (1x Leverage).")
@@ -36,7 +41,7 @@ class TimeBasedStrategy(Strategy):
         print(f"💰 Wallet Balance: {current_balance} USDT")
 
     def on_candle_tick(self, df: pd.DataFrame):
-        current_candle_time = df.iloc[-1]['timestamp']
+        current_candle_time = df['timestamp'].iat[-1]
         
         # --- Time Filter ---
         if self.last_processed_time == current_candle_time:
@@ -53,10 +58,11 @@ class TimeBasedStrategy(Strategy):
             return
 
         # --- EXECUTION ---
-        current_candle = df.iloc[-1]
-        price = current_candle['close']
+        price = df['close'].iat[-1]
+        # Read once per tick: in live trading each property access is an API call
+        pos = self.position
         
-        if not self.position:
+        if not pos:
             # --- BUY LOGIC ---
             wallet_balance = self.balance 
             margin_to_use = wallet_balance * self.risk_per_trade * self.target_leverage
@@ -64,12 +70,12 @@ class TimeBasedStrategy(Strategy):
             if self.is_spot:
                 # SPOT: Buy in USDT
                 qty = margin_to_use 
-                qty = round(qty, 4)
+                qty = math.floor(qty * self._qty_scale) / self._qty_scale
                 print(f"🚀 IMMEDIATE TRIGGER (SPOT): Buying {qty} USDT")
             else:
                 # FUTURES: Buy in Coins
                 qty = margin_to_use / price
-                qty = round(qty, 3)
+                qty = math.floor(qty * self._qty_scale) / self._qty_scale
                 print(f"🚀 IMMEDIATE TRIGGER (FUT): Buying {qty} XAUT")
 
             if qty > 0: 
@@ -82,7 +88,7 @@ class TimeBasedStrategy(Strategy):
         else:
             # --- SELL LOGIC ---
             print(f"📉 IMMEDIATE TRIGGER: SELLING Position")
-            qty = self.position['qty']
+            qty = pos['qty']
             self.sell(qty=qty)
             # تصفير العداد
             self.candle_counter = 0
\ No newline at end of file
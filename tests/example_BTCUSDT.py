@@ -1,23 +1,30 @@
 import time
+import os
 from RexLapisLib import Client, DataProcessor
 
 # =================================================================
 # CONFIGURATION
 # =================================================================
 SYMBOL = "BTCUSDT"
-API_KEY = "q0xnzgz3YlKQNMy0OY"
-API_SECRET = "y4fiS4lCnKqTdy6YmIslDjQwhDC7tGRSYf2p"
+# Read from the environment / .env file (loaded by RexLapisLib), never hardcoded
+API_KEY = os.getenv("API_KEY")
+API_SECRET = os.getenv("API_SECRET")
 ENVIRONMENT = "demo"
 # NEW: Define exactly where you want to save the data
 STORAGE_PATH = "./data" 
+STORAGE_FORMAT = "parquet"  # Falls back to CSV without pyarrow
 
 def run_comprehensive_data_test():
+    if not API_KEY or not API_SECRET:
+        print("Error: API Keys not found in .env file.")
+        return
+
     # 1. Initialize Client
     client = Client(symbol=SYMBOL, api_key=API_KEY, api_secret=API_SECRET, api_endpoint=ENVIRONMENT)
     
     # 2. Initialize DataProcessor with the required storage_dir
-    # The file will be saved as: ./data/BTCUSDT_history.csv
-    processor = DataProcessor(symbol=SYMBOL, storage_dir=STORAGE_PATH)
+    # The history will be saved in: ./data/BTCUSDT_history/ (Parquet part files)
+    processor = DataProcessor(symbol=SYMBOL, storage_dir=STORAGE_PATH, storage_format=STORAGE_FORMAT)
 
     print(f"\n{'='*50}")
     print(f"STARTING COMPREHENSIVE DATA TEST FOR {SYMBOL}")
@@ -31,12 +38,12 @@ def run_comprehensive_data_test():
     start_ts = int((time.time() - (48 * 60 * 60)) * 1000)
     historical_df = client.get_historical_klines(interval="1", start_time_ms=start_ts)
     
-    # 5. Save to CSV (Deduplication check)
+    # 5. Save to local storage (Deduplication check)
     processor.save_to_csv(historical_df)
     
     # 6. Verification
     local_data = processor.load_local_data()
-    print(f"Success! Local CSV in '{STORAGE_PATH}' contains {len(local_data)} records.")
+    print(f"Success! Local history in '{STORAGE_PATH}' contains {len(local_data)} records.")
 
 if __name__ == "__main__":
     run_comprehensive_data_test()
\ No newline at end of file
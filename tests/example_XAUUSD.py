@@ -1,58 +1,76 @@
 import time
 import os
+import asyncio
 from RexLapisLib import Client, DataProcessor
 
 # =================================================================
 # CONFIGURATION
 # =================================================================
-SYMBOL = "XAUTUSDT"     
-API_KEY = "q0xnzgz3YlKQNMy0OY"
-API_SECRET = "y4fiS4lCnKqTdy6YmIslDjQwhDC7tGRSYf2p"
-CATEGORY = "spot"       
-STORAGE_PATH = "./data" 
-INTERVAL = "1"          
-
-def run_continuous_stream():
-    client = Client(
-        symbol=SYMBOL, 
-        api_key=API_KEY, 
-        api_secret=API_SECRET, 
-        category=CATEGORY, 
-        api_endpoint="mainnet" 
-    )
-    processor = DataProcessor(symbol=SYMBOL, storage_dir=STORAGE_PATH)
-
-    print(f"--- Starting Continuous Stream for {SYMBOL} ---")
-    
+SYMBOLS = ["XAUTUSDT"]  # Every symbol is synced in parallel each cycle
+# Read from the environment / .env file (loaded by RexLapisLib), never hardcoded
+API_KEY = os.getenv("API_KEY")
+API_SECRET = os.getenv("API_SECRET")
+CATEGORY = "spot"
+STORAGE_PATH = "./data"
+STORAGE_FORMAT = "parquet"  # Falls back to CSV without pyarrow
+INTERVAL = "1"
+
+def sync_symbol(client, processor):
+    """One resume-and-fetch cycle for a single symbol (blocking; runs in a worker thread)."""
+    symbol = processor.symbol
+
+    # Only the newest timestamp is needed to resume, not the whole history
+    last_ts = processor.get_last_timestamp()
+    if last_ts:
+        print(f"[*] {symbol}: Resuming from last timestamp: {time.strftime('%Y-%m-%d %H:%M:%S', time.gmtime(last_ts / 1000))}")
+    else:
+        last_ts = int((time.time() - (24 * 60 * 60)) * 1000)
+        print(f"[!] {symbol}: No local data found. Starting from last 24 hours.")
+
     try:
-        while True:
-            existing_data = processor.load_local_data()
-            if not existing_data.empty:
-                last_ts = int(existing_data['timestamp'].max().timestamp() * 1000)
-                print(f"[*] Resuming from last timestamp: {existing_data['timestamp'].max()}")
-            else:
-                last_ts = int((time.time() - (24 * 60 * 60)) * 1000)
-                print("[!] No local data found. Starting from last 24 hours.")
-
-            try:
-                new_data = client.get_historical_klines(
-                    interval=INTERVAL, 
-                    start_time_ms=last_ts
-                )
-
-                if not new_data.empty:
-                    processor.save_to_csv(new_data)
-                    print(f"[+] Synced {len(new_data)} new candles.")
-                else:
-                    print("[.] Up to date. Waiting for new candle...")
-
-            except Exception as e:
-                print(f"[!] Error during fetch: {e}")
-
-            time.sleep(30)
+        new_data = client.get_historical_klines(
+            interval=INTERVAL,
+            start_time_ms=last_ts
+        )
 
-    except KeyboardInterrupt:
-        print("\n[!] Stream stopped by user. Saving and exiting...")
+        if not new_data.empty:
+            processor.save_to_csv(new_data)
+            print(f"[+] {symbol}: Synced {len(new_data)} new candles.")
+        else:
+            print(f"[.] {symbol}: Up to date. Waiting for new candle...")
+
+    except Exception as e:
+        print(f"[!] {symbol}: Error during fetch: {e}")
+
+async def run_continuous_stream():
+    if not API_KEY or not API_SECRET:
+        print("Error: API Keys not found in .env file.")
+        return
+
+    # One client (own pooled HTTP session) and one processor per symbol
+    feeds = [
+        (
+            Client(
+                symbol=symbol,
+                api_key=API_KEY,
+                api_secret=API_SECRET,
+                category=CATEGORY,
+                api_endpoint="mainnet"
+            ),
+            DataProcessor(symbol=symbol, storage_dir=STORAGE_PATH, storage_format=STORAGE_FORMAT),
+        )
+        for symbol in SYMBOLS
+    ]
+
+    print(f"--- Starting Continuous Stream for {', '.join(SYMBOLS)} ---")
+
+    while True:
+        # Round-trips overlap: a cycle costs the slowest fetch, not the sum of all of them
+        await asyncio.gather(*(asyncio.to_thread(sync_symbol, client, processor) for client, processor in feeds))
+        await asyncio.sleep(30)
 
 if __name__ == "__main__":
-    run_continuous_stream()
\ No newline at end of file
+    try:
+        asyncio.run(run_continuous_stream())
+    except KeyboardInterrupt:
+        print("\n[!] Stream stopped by user. Saving and exiting...")
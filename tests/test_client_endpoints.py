@@ -0,0 +1,68 @@
+import unittest
+from unittest import mock
+
+from RexLapisLib.core import client as client_module
+
+
+def make_client(api_endpoint):
+    with mock.patch.object(client_module, "HTTP"), \
+         mock.patch.object(client_module.Client, "_fetch_symbol_info", return_value={}):
+        return client_module.Client("BTCUSDT", "key", "secret", api_endpoint=api_endpoint)
+
+
+class StreamEndpointTest(unittest.TestCase):
+    """WebSocket constructors must target the same venue as the REST session."""
+
+    EXPECTED = {
+        # api_endpoint: (public stream kwargs, private stream kwargs)
+        "demo": ({"testnet": False}, {"testnet": False, "demo": True}),
+        "mainnet": ({"testnet": False}, {"testnet": False}),
+    }
+
+    def ws_kwargs(self, api_endpoint, start):
+        client = make_client(api_endpoint)
+        with mock.patch.object(client_module, "WebSocket") as ws:
+            start(client)
+        kwargs = dict(ws.call_args.kwargs)
+        kwargs.pop("channel_type")
+        kwargs.pop("api_key", None)
+        kwargs.pop("api_secret", None)
+        return kwargs
+
+    def test_kline_stream(self):
+        for api_endpoint, (public, _) in self.EXPECTED.items():
+            with self.subTest(api_endpoint=api_endpoint):
+                kwargs = self.ws_kwargs(api_endpoint, lambda c: c.start_kline_stream(print))
+                self.assertEqual(kwargs, public)
+
+    def test_order_stream(self):
+        for api_endpoint, (_, private) in self.EXPECTED.items():
+            with self.subTest(api_endpoint=api_endpoint):
+                kwargs = self.ws_kwargs(api_endpoint, lambda c: c.start_order_stream(print))
+                self.assertEqual(kwargs, private)
+
+    def test_ticker_stream(self):
+        for api_endpoint, (public, _) in self.EXPECTED.items():
+            with self.subTest(api_endpoint=api_endpoint):
+                kwargs = self.ws_kwargs(api_endpoint, lambda c: c.start_ticker_stream(print))
+                self.assertEqual(kwargs, public)
+
+
+class TradeSocketTest(unittest.TestCase):
+    def test_demo_keeps_orders_on_http(self):
+        client = make_client("demo")
+        with mock.patch.object(client_module, "WebSocketTrading") as ws_trading:
+            client.enable_ws_trading()
+        ws_trading.assert_not_called()
+        self.assertIsNone(client.ws_trade)
+
+    def test_mainnet_opens_trade_socket(self):
+        client = make_client("mainnet")
+        with mock.patch.object(client_module, "WebSocketTrading") as ws_trading:
+            client.enable_ws_trading()
+        self.assertEqual(ws_trading.call_args.kwargs["testnet"], False)
+        self.assertIs(client.ws_trade, ws_trading.return_value)
+
+
+if __name__ == "__main__":
+    unittest.main()
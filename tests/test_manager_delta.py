@@ -0,0 +1,96 @@
+import json
+import os
+import tempfile
+import unittest
+
+from RexLapisLib.core.manager import TradeManager, ExecutorState
+
+
+class DeltaLogTest(unittest.TestCase):
+    """save_delta() write-ahead log: snapshot + JSONL deltas replayed by load_from_disk()."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.state_file = os.path.join(self.tmp.name, "grid.json")
+        self.log_file = self.state_file + ".jsonl"
+        self.manager = self.make_manager()
+        self.manager.create_linear_traders(100.0, 104.0, 5, 1.0, 1.0, loop=True)
+
+    def make_manager(self):
+        return TradeManager(client=None, state_file=self.state_file)
+
+    def reload(self):
+        self.manager.wait_for_writes()
+        restored = self.make_manager()
+        restored.load_from_disk()
+        return restored.get_ui_data()
+
+    def log_lines(self):
+        self.manager.wait_for_writes()
+        with open(self.log_file, 'rb') as f:
+            return f.read().splitlines()
+
+    def test_snapshot_then_deltas_round_trip(self):
+        self.manager.save_delta()
+        self.assertEqual(len(self.log_lines()), 1)  # Header only
+
+        executor = self.manager.executors[0]
+        executor.state = ExecutorState.PLACED_ENTRY
+        executor.active_order_id = "order-1"
+        self.manager.save_delta()
+
+        self.manager.create_normal_traders(95.0, 105.0, 3, 0.5, 0.5)
+        self.manager.executors[2].state = ExecutorState.FILLED_WAIT
+        self.manager.executors[2].entry_fill_price = 102.0
+        self.manager.save_delta()
+
+        self.assertEqual(len(self.log_lines()), 3)
+        self.assertEqual(self.reload(), self.manager.get_ui_data())
+
+    def test_drop_completed_forces_snapshot(self):
+        self.manager.save_delta()
+        self.manager.executors[1].state = ExecutorState.COMPLETED
+        self.manager._drop_completed()
+        self.manager.save_delta()
+
+        # Rows were renumbered: a fresh snapshot replaces the log instead of a delta
+        self.assertEqual(len(self.log_lines()), 1)
+        self.assertEqual(len(self.manager.executors), 4)
+        self.assertEqual(self.reload(), self.manager.get_ui_data())
+
+    def test_log_with_mismatched_base_is_ignored(self):
+        self.manager.save_delta()
+        self.manager.executors[0].active_order_id = "order-1"
+        self.manager.executors[0].state = ExecutorState.PLACED_ENTRY
+        self.manager.save_delta()
+        self.assertEqual(len(self.log_lines()), 2)
+
+        # Replace the snapshot behind the log's back: its CRC no longer matches the header
+        with open(self.state_file) as f:
+            records = json.load(f)
+        records[3]["qty"] = 7.0
+        with open(self.state_file, 'w') as f:
+            json.dump(records, f)
+
+        restored = self.reload()
+        self.assertEqual(restored, records)
+        self.assertIsNone(restored[0]["active_order_id"])
+
+    def test_save_to_disk_removes_log(self):
+        self.manager.save_delta()
+        self.manager.executors[0].state = ExecutorState.PLACED_ENTRY
+        self.manager.save_delta()
+        self.assertTrue(os.path.exists(self.log_file))
+
+        self.manager.save_to_disk()
+        self.assertFalse(os.path.exists(self.log_file))
+        self.assertEqual(self.reload(), self.manager.get_ui_data())
+
+        # The next delta starts over from a fresh snapshot
+        self.manager.save_delta()
+        self.assertEqual(len(self.log_lines()), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()